@@ -4,14 +4,8 @@ from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 
 from alembic import context
-import sys
-import os
-from pathlib import Path
-
-# Add src to python path so we can import our modules
-# This assumes env.py is in <project>/alembic/env.py
-sys.path.append(str(Path(__file__).resolve().parent.parent / "src"))
 
+# src/ is put on sys.path by prepend_sys_path in alembic.ini (or by `pip install -e .`)
 from agent.db.base import Base, DATABASE_URL
 # Import all models so they are registered with the metadata
 from agent.db.models import *
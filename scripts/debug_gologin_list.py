@@ -23,14 +23,16 @@ for url in endpoints:
         if resp.status_code != 200:
              print(f"  Error: {resp.text[:200]}") # Truncate error
         if resp.status_code == 200:
-            profiles = resp.json().get('profiles', [])
-            if isinstance(resp.json(), list):
-                profiles = resp.json()
-            elif isinstance(resp.json(), dict) and 'profiles' not in resp.json():
-                 print(f"  Got dict response keys: {resp.json().keys()}")
-                 # Maybe 'browsers'?
-                 if 'browsers' in resp.json():
-                     profiles = resp.json()['browsers']
+            payload = resp.json() # Parse the body once, then dispatch on its shape
+            if isinstance(payload, list):
+                profiles = payload
+            elif isinstance(payload, dict):
+                if 'profiles' not in payload:
+                    print(f"  Got dict response keys: {payload.keys()}")
+                # Maybe 'browsers'?
+                profiles = payload.get('profiles') or payload.get('browsers') or []
+            else:
+                profiles = []
             
             print(f"  Success! Found: {len(profiles)} profiles")
             print(f"  Sample: {profiles[:1]}")
@@ -1,15 +1,12 @@
 #!/usr/bin/env python3
 """Ingest videos from Google Drive to DB & Create Runs."""
 
-import sys
 import os
 import uuid
 from pathlib import Path
 from datetime import datetime, timedelta
 
 # 1. Setup Environment
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from loguru import logger
 from dotenv import load_dotenv
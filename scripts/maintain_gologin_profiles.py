@@ -3,16 +3,11 @@
 
 import asyncio
 import time
-import sys
 import json
-import os
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Add src to path
-sys.path.append(os.path.join(os.getcwd(), "src"))
-
 from tools.gologin_browser import GoLoginBrowserManager
 from agent.config import Settings
 
@@ -2,13 +2,9 @@
 """Migrate accounts from accounts.json to SQLite."""
 
 import json
-import sys
 import argparse
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from agent.db.base import SessionLocal, engine
 from agent.db.models import Account, Base
 
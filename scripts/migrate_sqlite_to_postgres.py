@@ -1,16 +1,11 @@
 #!/usr/bin/env python3
 """Migrate entire database from SQLite to PostgreSQL."""
 
-import sys
 import argparse
 import os
-from pathlib import Path
 from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from agent.db.base import Base
 from agent.db.models import Account, UploadedAsset, PublishingRunPost, PublishingRunPostContent
 
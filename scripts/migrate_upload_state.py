@@ -2,14 +2,10 @@
 """Migrate upload state from JSON to SQLite."""
 
 import json
-import sys
 import argparse
 from pathlib import Path
 from datetime import datetime
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from agent.db.base import SessionLocal
 from agent.db.models import Account, UploadedAsset, PublishingRunPost, PublishingRunPostContent
 from agent.services.assets import AssetService
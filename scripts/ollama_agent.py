@@ -5,15 +5,11 @@ from __future__ import annotations
 
 import json
 import os
-import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
 import requests
 
-# Ensure src on path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from loguru import logger
 
 from agent.captions import generate_captions_from_title
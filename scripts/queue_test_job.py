@@ -1,10 +1,7 @@
-import sys
+import os
 from pathlib import Path
 from datetime import datetime, timezone
 
-# Add src manually because -I flag ignores PYTHONPATH
-sys.path.append(str(Path(__file__).resolve().parent.parent / "src"))
-
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,15 +10,18 @@ from agent.db.base import SessionLocal
 from agent.services.publishing_runs import PublishingRunService
 from agent.db.models import Asset, DummyAccount
 
+# Use relative path compatible with EC2 or Local (resolved once at import)
+BASE_DIR = Path(__file__).resolve().parent.parent
+VIDEO_PATH = BASE_DIR / "sample_videos" / "test_tiktok.mp4"
+
 def queue_test_job():
     session = SessionLocal()
     try:
         # 1. Ensure Asset Exists
-        # Use relative path compatible with EC2 or Local
-        base_dir = Path(__file__).resolve().parent.parent
-        video_path = base_dir / "sample_videos" / "test_tiktok.mp4"
-        
-        if not video_path.exists():
+        video_path = VIDEO_PATH
+        try:
+            os.stat(video_path)
+        except FileNotFoundError:
             print(f"Error: Video not found at {video_path}")
             return
 
@@ -43,10 +43,10 @@ def queue_test_job():
                 campaign_id=1 
             )
             session.add(asset)
-            session.commit()
-            session.refresh(asset)
+            session.flush() # INSERT ... RETURNING populates id/defaults, no refresh needed
         
-        print(f"Using Asset ID: {asset.id}")
+        asset_id = asset.id
+        print(f"Using Asset ID: {asset_id}")
 
         # 2. Get Account ID
         account_name = "viixenviices"
@@ -62,10 +62,10 @@ def queue_test_job():
                 launch_group_id=1 # Default group
             )
             session.add(account)
-            session.commit()
-            session.refresh(account)
+            session.flush()
             
-        print(f"Using Account ID: {account.id} ({account.name})")
+        account_id = account.id
+        print(f"Using Account ID: {account_id} ({account.name})")
 
         # 3. Queue Jobs (IG + TikTok)
         platforms = ["instagram", "tiktok"]
@@ -74,8 +74,8 @@ def queue_test_job():
             print(f"Queuing {platform} Post...")
             post = PublishingRunService.create_publishing_run(
                 session,
-                account_id=account.id,
-                asset_id=asset.id,
+                account_id=account_id,
+                asset_id=asset_id,
                 target_platform=platform,
                 scheduled_at=datetime.now(timezone.utc),
                 priority=10
@@ -4,12 +4,8 @@
 from __future__ import annotations
 
 import os
-import sys
 from pathlib import Path
 
-# Ensure src on path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from loguru import logger
 
 from agent.captions import generate_captions_from_title
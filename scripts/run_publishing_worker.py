@@ -1,11 +1,7 @@
 #!/usr/bin/env python3
 import sys
-import os
 from datetime import datetime, timezone
-from sqlalchemy import select, or_, and_
-
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+from sqlalchemy import select, or_, exists, bindparam
 
 from agent.db.base import SessionLocal
 from agent.db.models import PublishingRun
@@ -13,23 +9,26 @@ from agent.jobs.publishing import PublishingJob
 from loguru import logger
 
 MAX_RUNS_PER_INVOCATION = 10
+PENDING_STATUSES = ["PENDING", "SCHEDULED", "RETRY"]
+
+# "Pending work" means rows where status in ["PENDING", "SCHEDULED", "RETRY"]
+# AND (scheduled_at IS NULL OR scheduled_at <= now)
+# Built once with bound parameters (expanding IN list) so the compiled form is
+# reused across invocations instead of being re-rendered per call.
+PENDING_RUNS_EXIST_STMT = select(
+    exists().where(
+        PublishingRun.status.in_(bindparam("statuses", expanding=True)),
+        or_(PublishingRun.scheduled_at.is_(None), PublishingRun.scheduled_at <= bindparam("now"))
+    )
+)
 
 def has_pending_runs(session) -> bool:
-    now = datetime.now(timezone.utc)
-    # Check for pending, retry, or scheduled <= now
     # We use the same logic as PublishingRunService.get_pending_runs usually, 
     # but here we just want to know if we should START the job.
-    
-    # "Pending work" means rows where status in ["PENDING", "SCHEDULED", "RETRY"]
-    # AND (scheduled_at IS NULL OR scheduled_at <= now)
-    
-    stmt = select(PublishingRun).where(
-        PublishingRun.status.in_(["PENDING", "SCHEDULED", "RETRY"]),
-        or_(PublishingRun.scheduled_at == None, PublishingRun.scheduled_at <= now)
-    ).limit(1)
-    
-    result = session.execute(stmt).scalar_one_or_none()
-    return result is not None
+    return bool(session.execute(
+        PENDING_RUNS_EXIST_STMT,
+        {"statuses": PENDING_STATUSES, "now": datetime.now(timezone.utc)}
+    ).scalar())
 
 def main() -> int:
     # Setup logger to stdout/stderr for systemd
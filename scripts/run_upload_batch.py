@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Run several test uploads from one TOML file inside a single Python process.
+
+Each job reuses the matching test_*_upload script's parser and main(), so the
+interpreter start-up and the Selenium/uploader imports are paid once for the
+whole batch instead of once per invocation.
+
+Usage:
+    PYTHONPATH=src python scripts/run_upload_batch.py uploads.toml
+
+uploads.toml:
+    [[upload]]
+    platform = "tiktok"
+    args = ["--video", "/abs/path/a.mp4", "--caption", "UCJ TikTok test"]
+
+    [[upload]]
+    platform = "youtube"
+    args = ["--video", "/abs/path/b.mp4", "--title", "Test", "--profile-dir", "/abs/path/profile"]
+"""
+
+import argparse
+import sys
+import tomllib
+from pathlib import Path
+
+import test_instagram_upload
+import test_tiktok_upload
+import test_youtube_upload
+
+UPLOADERS = {
+    "tiktok": test_tiktok_upload.main,
+    "youtube": test_youtube_upload.main,
+    "instagram": test_instagram_upload.main,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a batch of test uploads from a TOML file")
+    parser.add_argument("config", type=Path, help="TOML file with [[upload]] entries")
+    args = parser.parse_args()
+
+    with args.config.open("rb") as fh:
+        jobs = tomllib.load(fh).get("upload", [])
+
+    failed = 0
+    for i, job in enumerate(jobs, 1):
+        platform = job.get("platform", "")
+        upload = UPLOADERS.get(platform)
+        if upload is None:
+            print(f"[{i}/{len(jobs)}] Unknown platform {platform!r}, skipping")
+            failed += 1
+            continue
+
+        print(f"[{i}/{len(jobs)}] {platform}: {' '.join(job.get('args', []))}")
+        try:
+            upload(job.get("args", []))
+        except SystemExit as e:
+            # The upload scripts exit non-zero on failure (and argparse on bad args)
+            if e.code:
+                failed += 1
+        except Exception as e:
+            # e.g. missing platform config or a driver error: count it and keep going
+            print(f"[{i}/{len(jobs)}] {platform} failed: {type(e).__name__}: {e}")
+            failed += 1
+
+    print(f"\nDone: {len(jobs) - failed} succeeded, {failed} failed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
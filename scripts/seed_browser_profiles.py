@@ -2,49 +2,45 @@
 
 This script migrates GoLogin profile IDs from .env into browser_provider_profiles.
 """
-import sys
-from pathlib import Path
 import os
 
-# Add src to path FIRST (before any project imports)
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-
-from dotenv import load_dotenv
-load_dotenv()
+from dotenv import dotenv_values
 
 from agent.db.base import SessionLocal
 from agent.db.models import BrowserProvider, BrowserProviderProfile, DummyAccount
 from agent.services.browser_provider_allocator import BrowserProviderAllocator
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
 
+# .env parsed once into a plain dict; real environment variables still win,
+# matching load_dotenv() semantics without exporting into os.environ
+ENV = {**dotenv_values(), **os.environ}
 
 # GoLogin profile mappings from .env
-GOLOGIN_PROFILES = {
-    'viixenviices': os.getenv('GOLOGIN_PROFILE_VIIXENVIICES'),
-    'popmessparis': os.getenv('GOLOGIN_PROFILE_POPMESSPARIS'),
-    'halohavok': os.getenv('GOLOGIN_PROFILE_HALOHAVOK'),
-    'cigsntofu': os.getenv('GOLOGIN_PROFILE_CIGSNTOFU'),
-    'lavenderliqour': os.getenv('GOLOGIN_PROFILE_LAVENDERLIQOUR'),
-    'hotcaviarx': os.getenv('GOLOGIN_PROFILE_HOTCAVIARX'),
-}
+GOLOGIN_ACCOUNTS = ("viixenviices", "popmessparis", "halohavok", "cigsntofu", "lavenderliqour", "hotcaviarx")
+GOLOGIN_PROFILES = {name: ENV.get(f"GOLOGIN_PROFILE_{name.upper()}") for name in GOLOGIN_ACCOUNTS}
 
 
 def seed_profiles():
     session = SessionLocal()
     try:
         # Get GoLogin provider
-        gologin = session.execute(
-            select(BrowserProvider).where(BrowserProvider.code == 'GOLOGIN')
+        gologin_id = session.execute(
+            select(BrowserProvider.id).where(BrowserProvider.code == 'GOLOGIN')
         ).scalar_one_or_none()
         
-        if not gologin:
+        if gologin_id is None:
             print("ERROR: GoLogin provider not found. Run migration first.")
             return
         
-        print(f"Found GoLogin provider (ID: {gologin.id})")
+        print(f"Found GoLogin provider (ID: {gologin_id})")
         
         created = 0
         skipped = 0
+        rows = []
+        account_by_ref = {}
         
         for account_name, profile_id in GOLOGIN_PROFILES.items():
             if not profile_id:
@@ -53,11 +49,11 @@ def seed_profiles():
                 continue
             
             # Find dummy account by name
-            account = session.execute(
-                select(DummyAccount).where(DummyAccount.name.ilike(f"%{account_name}%"))
+            account_id = session.execute(
+                select(DummyAccount.id).where(DummyAccount.name.ilike(f"%{account_name}%"))
             ).scalar_one_or_none()
             
-            if not account:
+            if account_id is None:
                 # Create dummy account if it doesn't exist
                 print(f"Creating dummy account: {account_name}")
                 account = DummyAccount(
@@ -68,31 +64,34 @@ def seed_profiles():
                 )
                 session.add(account)
                 session.flush()
+                account_id = account.id
             
-            # Check if profile already exists
-            existing = session.execute(
-                select(BrowserProviderProfile).where(
-                    BrowserProviderProfile.browser_provider_id == gologin.id,
-                    BrowserProviderProfile.provider_profile_ref == profile_id
-                )
-            ).scalar_one_or_none()
-            
-            if existing:
-                print(f"SKIP: Profile already exists for {account_name} ({profile_id})")
-                skipped += 1
-                continue
+            account_by_ref[profile_id] = account_name
+            rows.append({
+                "browser_provider_id": gologin_id,
+                "dummy_account_id": account_id,
+                "provider_profile_ref": profile_id,
+                "status": 'active',
+                "is_default": True,
+            })
+        
+        # Create browser provider profiles in one statement.
+        # ON CONFLICT on the (browser_provider_id, provider_profile_ref) unique index
+        # replaces the per-row existence check and is safe against parallel seed runs.
+        if rows:
+            insert = pg_insert if session.get_bind().dialect.name == "postgresql" else sqlite_insert
+            stmt = insert(BrowserProviderProfile).values(rows).on_conflict_do_nothing(
+                index_elements=["browser_provider_id", "provider_profile_ref"]
+            ).returning(BrowserProviderProfile.provider_profile_ref)
+            inserted_refs = set(session.execute(stmt).scalars().all())
             
-            # Create browser provider profile
-            profile = BrowserProviderProfile(
-                browser_provider_id=gologin.id,
-                dummy_account_id=account.id,
-                provider_profile_ref=profile_id,
-                status='active',
-                is_default=True
-            )
-            session.add(profile)
-            print(f"CREATED: {account_name} -> {profile_id}")
-            created += 1
+            for profile_id, account_name in account_by_ref.items():
+                if profile_id in inserted_refs:
+                    print(f"CREATED: {account_name} -> {profile_id}")
+                    created += 1
+                else:
+                    print(f"SKIP: Profile already exists for {account_name} ({profile_id})")
+                    skipped += 1
         
         session.commit()
         print(f"\nDone: {created} created, {skipped} skipped")
@@ -51,38 +51,29 @@ def seed_remote_headless_raw():
         
         logger.info(f"Provider ID: {provider_id}")
 
-        # 2. Get All Dummy Accounts
-        accounts_raw = run_psql("SELECT id, name FROM dummy_accounts")
-        if not accounts_raw:
-             logger.warning("No dummy accounts found")
-             return
-
-        for line in accounts_raw.split('\n'):
-            parts = line.strip().split('|')
-            if len(parts) < 2: continue
-            
-            acc_id = int(parts[0].strip())
-            acc_name = parts[1].strip()
-            
-            # Check for existing profile
-            # Using raw check
-            check_prof = f"SELECT id FROM browser_provider_profiles WHERE dummy_account_id = {acc_id} AND browser_provider_id = {provider_id}"
-            prof_id = run_psql(check_prof)
-            
-            # Check if we got a valid ID or empty string
-            if not prof_id or not prof_id.strip():
-                logger.info(f"Adding profile for {acc_name}")
-
-                ref = f"remote-headless-{acc_name}"
-                conf_json = '{"proxy_enabled": false}'
-                insert_prof = f"""
-                    INSERT INTO browser_provider_profiles 
-                    (browser_provider_id, dummy_account_id, provider_profile_ref, status, is_default, created_at, updated_at)
-                    VALUES ({provider_id}, {acc_id}, '{ref}', 'active', false, NOW(), NOW());
-                """
-                run_psql(insert_prof)
-            else:
-                logger.info(f"Profile exists for {acc_name}")
+        # 2. Add a profile for every dummy account that lacks one, in ONE statement.
+        # ON CONFLICT on the (browser_provider_id, provider_profile_ref) unique index
+        # makes parallel seed runs safe instead of SELECT-then-INSERT per account.
+        insert_prof = f"""
+            INSERT INTO browser_provider_profiles 
+            (browser_provider_id, dummy_account_id, provider_profile_ref, status, is_default, created_at, updated_at)
+            SELECT {provider_id}, da.id, 'remote-headless-' || da.name, 'active', false, NOW(), NOW()
+            FROM dummy_accounts da
+            WHERE NOT EXISTS (
+                SELECT 1 FROM browser_provider_profiles bpp
+                WHERE bpp.dummy_account_id = da.id AND bpp.browser_provider_id = {provider_id}
+            )
+            ON CONFLICT (browser_provider_id, provider_profile_ref) DO NOTHING
+            RETURNING provider_profile_ref;
+        """
+        # psql may append the "INSERT 0 N" command tag after the RETURNING rows
+        added = [
+            line.strip() for line in run_psql(insert_prof).split('\n')
+            if line.strip() and not line.strip().startswith("INSERT ")
+        ]
+        for ref in added:
+            logger.info(f"Added profile {ref}")
+        logger.info(f"{len(added)} profile(s) added")
 
         logger.success("Seeding Complete via PSQL")
 
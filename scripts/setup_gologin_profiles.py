@@ -5,25 +5,45 @@ One profile per account (handling all platforms).
 """
 
 import os
-import sys
 import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from dotenv import load_dotenv
 
-# Add src to path
-sys.path.append(os.path.join(os.getcwd(), "src"))
-from gologin import GoLogin
-
 load_dotenv()
 
 # Configuration Constants
 ACCOUNTS_FILE = Path("accounts.json")
 GOLOGIN_TOKEN_1 = os.getenv("GOLOGIN_TOKEN_1")
 GOLOGIN_TOKEN_2 = os.getenv("GOLOGIN_TOKEN_2") # For splitting if needed
+PROFILES_URL = "https://api.gologin.com/browser/v2/profiles"
+PROFILES_PAGE_SIZE = 50
+PROFILES_FETCH_WORKERS = 3  # Concurrent page fetches; GoLogin answers bursts with 429
+
+# Back off and retry throttled calls (honours Retry-After). Only 429 is retried,
+# so non-idempotent PATCH/POST are never replayed after a connection error.
+API_RETRY = Retry(
+    total=3,
+    connect=0,
+    read=0,
+    status=3,
+    status_forcelist=[429],
+    allowed_methods=None,
+    backoff_factor=0.5,
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Profile-update endpoint the API accepted ("v2" or "rename"); probed on first update
+_update_endpoint = None
 
-# Anti-Detect Config Defaults
-BASE_FINGERPRINT = {
+# Anti-Detect Config Defaults (read-only; per-account fields are merged on top)
+BASE_FINGERPRINT = MappingProxyType({
     "os": "lin", # Linux provides good obscure fingerprint
     "navigator": {
         "language": "en-US,en",
@@ -44,7 +64,7 @@ BASE_FINGERPRINT = {
     "proxy": {
         "mode": "none" 
     }
-}
+})
 
 # Specific geo-locations to mimic "real" distributed users across US
 GEO_LOCATIONS = [
@@ -73,32 +93,92 @@ def get_token_for_index(idx, total):
 
 def generate_fingerprint_config(account_name, idx):
     """Generate a consistent unique fingerprint for an account."""
-    config = BASE_FINGERPRINT.copy()
-    
     # Assign specific location based on index
     geo = GEO_LOCATIONS[idx % len(GEO_LOCATIONS)]
-    
-    config["name"] = account_name # Set profile name
-    
-    config["geolocation"] = {
-        "mode": "allow",
-        "fillBasedOnIp": False, 
-        "latitude": geo["lat"],
-        "longitude": geo["lon"],
-        "accuracy": 100
-    }
-    
-    config["timezone"] = {
-        "enabled": True,
-        "fillBasedOnIp": False,
-        "timezone": geo["timezone"]
+
+    return {
+        **BASE_FINGERPRINT,
+        "name": account_name,
+        "geolocation": {
+            "mode": "allow",
+            "fillBasedOnIp": False,
+            "latitude": geo["lat"],
+            "longitude": geo["lon"],
+            "accuracy": 100
+        },
+        "timezone": {
+            "enabled": True,
+            "fillBasedOnIp": False,
+            "timezone": geo["timezone"]
+        },
     }
-    
-    # Deep copy nested dicts to avoid mutation if we were reusing base directly
-    # But copy() is shallow. Re-defining navigator usually safer or deepcopy.
-    # For now, simplistic approach.
-    
-    return config
+
+def build_api_session(token):
+    """Keep-alive HTTP session for one token, shared by every API call made with it."""
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json"
+    })
+    session.mount("https://", HTTPAdapter(pool_maxsize=PROFILES_FETCH_WORKERS, max_retries=API_RETRY))
+    return session
+
+def fetch_profiles_page(session, page):
+    """Fetch one page of profiles; returns (profiles, total_count).
+
+    Raises RuntimeError if the page cannot be listed: an empty page would make
+    the profiles on it look absent.
+    """
+    params = {"limit": PROFILES_PAGE_SIZE, "page": page}
+    try:
+        resp = session.get(PROFILES_URL, params=params)
+    except Exception as e:
+        raise RuntimeError(f"Error listing page {page}: {e}") from e
+    if resp.status_code != 200:
+        raise RuntimeError(f"Error listing page {page}: {resp.status_code} {resp.text}")
+    data = orjson.loads(resp.content)
+    profiles = data.get("profiles", [])
+    return profiles, data.get("allProfilesCount", len(profiles))
+
+def fetch_profiles(session):
+    """List every GoLogin profile visible to a token.
+
+    The first page reports the total count; any remaining pages are fetched
+    concurrently rather than one after another. Raises RuntimeError if any
+    page fails, rather than returning a partial list.
+    """
+    profiles, total = fetch_profiles_page(session, 1)
+    page_count = -(-total // PROFILES_PAGE_SIZE)
+    if page_count <= 1:
+        return profiles
+
+    with ThreadPoolExecutor(max_workers=PROFILES_FETCH_WORKERS) as pool:
+        pages = pool.map(lambda page: fetch_profiles_page(session, page)[0], range(2, page_count + 1))
+        for page_profiles in pages:
+            profiles.extend(page_profiles)
+    return profiles
+
+def update_profile(session, profile_id, update_data):
+    """Apply a fingerprint update, remembering which endpoint the API accepts.
+
+    PATCH /browser/v2/profiles/{id} is tried first. If the API rejects that
+    route (405), later updates go straight to the POST rename fallback
+    instead of paying for a failed PATCH on every profile.
+    """
+    global _update_endpoint
+
+    if _update_endpoint != "rename":
+        r = session.patch(f"https://api.gologin.com/browser/v2/profiles/{profile_id}", data=orjson.dumps(update_data))
+        if r.status_code == 200:
+            _update_endpoint = "v2"
+            return
+        if r.status_code == 405 and _update_endpoint is None:
+            _update_endpoint = "rename"
+
+    # Fallback POST rename (only the name is applied)
+    r = session.post(f"https://api.gologin.com/browser/{profile_id}/rename", data=orjson.dumps({"name": update_data["name"]}))
+    if r.status_code != 200:
+        print(f"Rename failed: {r.status_code} {r.text}")
 
 def setup_profiles():
     accounts = load_accounts()
@@ -107,10 +187,48 @@ def setup_profiles():
 
     print(f"Found {len(accounts)} accounts. Configuring GoLogin profiles...")
     
+    all_labels = frozenset(a['label'] for a in accounts)  # built once, checked per candidate
+    
+    # One pooled session per token, reused for listing, updates and creates
+    tokens = {get_token_for_index(i, len(accounts)) for i in range(len(accounts))}
+    sessions = {t: build_api_session(t) for t in tokens if t}
+    try:
+        _setup_profiles(accounts, sessions, all_labels)
+    finally:
+        for session in sessions.values():
+            session.close()
+
+def _setup_profiles(accounts, sessions, all_labels):
     env_lines = []
     
     assigned_ids = set() # Track IDs we've touched to avoid double-reuse
     
+    # Profile IDs recorded in .env by a previous run. A token whose accounts
+    # are all known needs no listing at all (the common re-run case).
+    known_ids = {a["label"]: os.getenv(f"GOLOGIN_PROFILE_{a['label'].upper()}") for a in accounts}
+    tokens_to_list = {
+        get_token_for_index(i, len(accounts))
+        for i, a in enumerate(accounts)
+        if not known_ids[a["label"]]
+    }
+    
+    # 1. List profiles ONCE per token (not once per account) and index by name.
+    # None marks a token whose listing failed: its profiles are unknown.
+    profiles_by_token = {}
+    for t, session in sessions.items():
+        if t not in tokens_to_list:
+            profiles_by_token[t] = []
+            continue
+        try:
+            profiles_by_token[t] = fetch_profiles(session)
+        except RuntimeError as e:
+            print(f"{e}. Profiles for this token will not be reused or created.")
+            profiles_by_token[t] = None
+    profiles_by_name = {
+        t: {p.get("name"): p.get("id") for p in profiles or []}
+        for t, profiles in profiles_by_token.items()
+    }
+    
     for i, account in enumerate(accounts):
         label = account["label"]
         # Use email as key identifier for "Profile Name" to keep it distinct
@@ -124,50 +242,36 @@ def setup_profiles():
             print(f"Skipping {label}: No token available.")
             continue
             
-        gl = GoLogin({
-            "token": token,
-            "port": 3500 + i
-        })
-            
-        # Headers for API
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-        
-        target_id = None
+        # Pooled API session (auth headers already set)
+        session = sessions[token]
         
-        # 1. List Profiles to find match or reusable
-        try:
-            resp = requests.get("https://api.gologin.com/browser/v2/profiles?limit=50", headers=headers)
-            if resp.status_code == 200:
-                profiles = resp.json().get("profiles", [])
-                
-                # A. Try exact name match (label or email)
-                email_target = account["platforms"]["instagram"]["username"]
-                
-                for p in profiles:
-                    p_name = p.get("name")
-                    p_id = p.get("id")
-                    if p_name == profile_name or p_name == email_target:
-                        target_id = p_id
-                        print(f"[{label}] Found existing profile: {target_id} (Name: {p_name})")
-                        break
-                # B. Reuse unused profile if no match
-                if not target_id:
-                   # Find one that isn't in our list of 'assigned' OR 'known names'
-                   all_labels = {a['label'] for a in accounts}
-                   
-                   for p in profiles:
-                       pid = p.get("id")
-                       pname = p.get("name")
-                       if pid not in assigned_ids and pname not in all_labels:
-                           target_id = pid
-                           print(f"[{label}] Reusing profile: {target_id} ({pname})")
-                           break
-                           
-        except Exception as e:
-            print(f"Error listing: {e}")
+        # A. Try exact name match (label or email)
+        email_target = account.get("platforms", {}).get("instagram", {}).get("username")
+        target_id = profiles_by_name[token].get(profile_name) or profiles_by_name[token].get(email_target)
+        if token not in tokens_to_list:
+            target_id = known_ids[label]
+            print(f"[{label}] Using ID from env: {target_id}")
+        elif profiles_by_token[token] is None:
+            # Incomplete listing: this account's profile may be on a page we could
+            # not read, so neither reuse another profile nor create a duplicate
+            target_id = known_ids[label]
+            if not target_id:
+                print(f"[{label}] Skipping: profile listing failed for its token.")
+                continue
+            print(f"[{label}] Using ID from env: {target_id}")
+        elif target_id:
+            print(f"[{label}] Found existing profile: {target_id}")
+        else:
+            # B. Reuse unused profile if no match
+            # Find one that isn't in our list of 'assigned' OR 'known names'
+            reused = next(
+                (p for p in profiles_by_token[token]
+                 if p.get("id") not in assigned_ids and p.get("name") not in all_labels),
+                None,
+            )
+            if reused:
+                target_id = reused.get("id")
+                print(f"[{label}] Reusing profile: {target_id} ({reused.get('name')})")
 
         # Fallback: Check if we already have this profile in env
         if not target_id:
@@ -196,12 +300,7 @@ def setup_profiles():
              
              # Patch
              try:
-                 # PATCH /browser/v2/profiles/{id}
-                 # Some docs say /browser/{id}
-                 r = requests.patch(f"https://api.gologin.com/browser/v2/profiles/{target_id}", json=update_data, headers=headers)
-                 if r.status_code != 200:
-                     # Fallback POST rename/update
-                     requests.post(f"https://api.gologin.com/browser/{target_id}/rename", json={"name": profile_name}, headers=headers)
+                 update_profile(session, target_id, update_data)
              except Exception as e:
                  print(f"Update failed: {e}")
                  
@@ -210,7 +309,7 @@ def setup_profiles():
         else:
             # Create
             print(f"[{label}] Creating new profile...")
-            # Fallback to direct API call because SDK gl.create is failing on fingerprint fetch
+            # Direct API call because the SDK's create is failing on fingerprint fetch
             # We strictly define all fields so we don't rely on auto-fetch
             try:
                  # Ensure we have all mandatory fields for creation
@@ -232,9 +331,9 @@ def setup_profiles():
                  })
                  
                  # POST v2
-                 r = requests.post("https://api.gologin.com/browser/v2/profiles", json=create_payload, headers=headers)
+                 r = session.post("https://api.gologin.com/browser/v2/profiles", data=orjson.dumps(create_payload))
                  if r.status_code == 200:
-                     target_id = r.json().get("id")
+                     target_id = orjson.loads(r.content).get("id")
                      print(f"[{label}] Created: {target_id}")
                      assigned_ids.add(target_id)
                  else:
@@ -1,12 +1,8 @@
 #!/usr/bin/env python3
 import sys
-import os
 from datetime import datetime, timezone
 from sqlalchemy import text
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
-
 from agent.db.base import SessionLocal
 from agent.jobs.publishing import PublishingJob
 from agent.services.launch_group_service import LaunchGroupService
@@ -24,9 +20,8 @@ def smoke_test():
         print("[SmokeTest] Setting up test LaunchGroup and Run...")
         group = LaunchGroup(name="SmokeTestGroup", max_runs_per_day=0) # Zero limit to test blocking
         session.add(group)
-        session.commit()
-        # Fetch group ID
-        group_id = session.execute(text("SELECT id FROM launch_groups WHERE name='SmokeTestGroup' ORDER BY id DESC LIMIT 1")).scalar()
+        session.flush()  # INSERT ... RETURNING id, kept inside the open transaction
+        group_id = group.id
         
         # Test 1: Quota Block
         print(f"[SmokeTest] Testing Quota Block (Group {group_id} has limit 0)...")
@@ -38,9 +33,8 @@ def smoke_test():
             return 1
             
         # Cleanup
-        # Use ORM delete to ensure session state stays consistent
-        session.delete(group)
-        session.commit()
+        # The test group was never committed, so rolling back discards it
+        session.rollback()
         print("[SmokeTest] Cleanup complete.")
         
     except Exception as e:
@@ -53,7 +47,4 @@ def smoke_test():
     return 0
 
 if __name__ == "__main__":
-    if "src" not in sys.path[-1]:
-         # Rough check if path is set
-         pass
     sys.exit(smoke_test())
@@ -46,7 +46,9 @@ CMD_ID=$(aws ssm send-command \
     \"echo '[DEPLOY] Venv + deps'\",
     \"sudo -u ec2-user -H bash -lc 'APP=/home/ec2-user/un-cvnt-jams; set -euo pipefail; cd \$APP; python3 -m venv venv; \
       source venv/bin/activate; pip install -U pip; \
-      PIP_NO_CACHE_DIR=1 pip install -r requirements.txt'\",
+      PIP_NO_CACHE_DIR=1 pip install -r requirements.txt; \
+      PIP_NO_CACHE_DIR=1 pip install --no-deps -e .; \
+      python -m compileall -q src'\",
 
     \"echo '[DEPLOY] Configure .env'\",
     \"sudo -u ec2-user -H bash -lc 'APP=/home/ec2-user/un-cvnt-jams; set -euo pipefail; cd \$APP; \
@@ -55,8 +57,8 @@ CMD_ID=$(aws ssm send-command \
 
     \"echo '[DEPLOY] Phase 1 Verification: Test Lazy Imports'\",
     \"sudo -u ec2-user -H bash -lc 'APP=/home/ec2-user/un-cvnt-jams; set -euo pipefail; cd \$APP; source venv/bin/activate; \
-      python3 -c \\\"import sys; sys.path.append(\\\\\\\"src\\\\\\\"); from agent.workflow import run_cycle_single; print(\\\\\\\"Workflow Import OK\\\\\\\")\\\"; \
-      python3 -c \\\"import sys; sys.path.append(\\\\\\\"src\\\\\\\"); from agent.jobs.publishing import PublishingJob; print(\\\\\\\"Job Import OK\\\\\\\")\\\"'\",
+      python3 -c \\\"from agent.workflow import run_cycle_single; print(\\\\\\\"Workflow Import OK\\\\\\\")\\\"; \
+      python3 -c \\\"from agent.jobs.publishing import PublishingJob; print(\\\\\\\"Job Import OK\\\\\\\")\\\"'\",
 
     \"echo '[DEPLOY] Phase 2: Start Timer'\",
     \"systemctl daemon-reload || true\",
@@ -21,8 +21,14 @@ try:
         dbname=DB_NAME,
         user=DB_USER,
         password=DB_PASS,
-        sslmode='require'
+        sslmode='require',
+        gssencmode='disable',  # Skip the GSSAPI negotiation round-trip before TLS
+        application_name='smoke-test',  # Identifies this client in RDS Performance Insights
+        connect_timeout=10
     )
+    with conn.cursor() as cur:
+        cur.execute("SELECT 1")
+        cur.fetchone()
     print("SUCCESS: Connection established!")
     conn.close()
 except Exception as e:
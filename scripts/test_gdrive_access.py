@@ -1,14 +1,10 @@
 #!/usr/bin/env python3
 """Verify Google Drive Access."""
 
-import sys
 import os
 from pathlib import Path
 from loguru import logger
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from agent.source_gdrive import build_drive_client
 
 def test_access():
@@ -26,7 +22,7 @@ def test_access():
         # Query for a 'test' folder or just list 1 file
         results = service.files().list(
             pageSize=1, 
-            fields="nextPageToken, files(id, name)"
+            fields="files(id)"  # Liveness probe: ask Drive for nothing we don't print
         ).execute()
         items = results.get('files', [])
 
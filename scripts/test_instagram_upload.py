@@ -15,21 +15,15 @@ For headless mode:
       --headless
 """
 
+import argparse
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from agent.config import load_settings, InstagramConfig
 from loguru import logger
-from tools.instagram_client import InstagramClient
-
 
-def main() -> None:
-    """Test Instagram upload."""
-    import argparse
 
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line options for one Instagram test upload."""
     parser = argparse.ArgumentParser(description="Test Instagram upload")
     parser.add_argument("--video", type=Path, required=True, help="Path to video file")
     parser.add_argument("--caption", type=str, default="UCJ Instagram test upload", help="Video caption")
@@ -46,21 +40,29 @@ def main() -> None:
         help="Max seconds to wait for HITL login before failing",
     )
     parser.add_argument("--cdp-port", type=int, default=None, help="CDP port for DevTools screencast")
+    return parser
 
-    args = parser.parse_args()
+
+def main(argv: list[str] | None = None) -> None:
+    """Test Instagram upload."""
+    args = build_parser().parse_args(argv)
+
+    # Deferred so `--help` and argument errors skip the browser-automation imports
+    from agent.config import load_settings, InstagramConfig
+    from tools.instagram_client import InstagramClient
 
     video_path = args.video
-    if not video_path.exists():
+    if not video_path.is_file():  # one stat: missing paths and directories both fail
         print(f"Error: Video file not found: {video_path}")
         sys.exit(1)
 
     profile_dir = args.profile_dir
-    if not profile_dir.exists():
+    if not profile_dir.is_dir():
         print(f"Error: Profile directory not found: {profile_dir}")
         sys.exit(1)
 
-    # Load settings and override with CLI args
-    settings = load_settings()
+    # Load settings and override with CLI args (on a copy; load_settings() is shared)
+    settings = load_settings().model_copy(deep=True)
     if settings.instagram:
         # Override profile_dir and headless from CLI
         settings.instagram.profile_dir = profile_dir
@@ -106,11 +108,8 @@ def main() -> None:
         client = InstagramClient(settings.instagram)
         client.upload(video_path, args.caption, post_type=args.post_type)
         print("✅ Upload successful!")
-    except Exception as e:
-        print(f"❌ Upload failed: {e}")
-        import traceback
-
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Upload failed")
         sys.exit(1)
 
 
@@ -11,37 +11,47 @@ For headless mode:
       --video /abs/path/to/video.mp4 \\
       --caption "UCJ TikTok test" \\
       --headless
+
+Several videos, one after another in a single browser session:
+    PYTHONPATH=src python scripts/test_tiktok_upload.py \\
+      --video /abs/path/a.mp4 /abs/path/b.mp4 /abs/path/c.mp4
 """
 
+from __future__ import annotations
+
+import argparse
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from agent.config import load_settings, TikTokConfig
 from loguru import logger
-from tools.tiktok_client import TikTokClient
 
+from upload_inputs import check_videos
+
+if TYPE_CHECKING:
+    from agent.config import TikTokConfig
 
-def main() -> None:
-    """Test TikTok upload."""
-    import argparse
 
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line options for one TikTok test upload."""
     parser = argparse.ArgumentParser(description="Test TikTok upload")
-    parser.add_argument("--video", type=Path, required=True, help="Path to video file")
+    parser.add_argument("--video", type=Path, nargs="+", required=True, help="Path to video file(s)")
     parser.add_argument("--caption", type=str, default="UCJ TikTok test upload", help="Video caption")
     parser.add_argument("--headless", action="store_true", help="Override headless to True")
+    return parser
 
-    args = parser.parse_args()
 
-    video_path = args.video
-    if not video_path.exists():
-        print(f"Error: Video file not found: {video_path}")
-        sys.exit(1)
+def main(argv: list[str] | None = None) -> None:
+    """Test TikTok upload."""
+    args = build_parser().parse_args(argv)
 
-    # Load settings and override headless if specified
-    settings = load_settings()
+    # Deferred so `--help` and argument errors skip the uploader/Selenium imports
+    from agent.config import load_settings, TikTokConfig
+
+    check_videos(args.video)
+
+    # Load settings and override headless if specified (on a copy; load_settings() is shared)
+    settings = load_settings().model_copy(deep=True)
     if not settings.tiktok:
         raise ValueError("TikTok config not found in settings. Ensure TIKTOK_COOKIES_PATH is set in .env")
 
@@ -64,19 +74,35 @@ def main() -> None:
         )
 
     # Upload
-    try:
-        print(f"Uploading {video_path} to TikTok...")
-        client = TikTokClient(settings.tiktok)
-        client.upload_single(video_path, args.caption)
-        print("✅ Upload successful!")
-    except Exception as e:
-        print(f"❌ Upload failed: {e}")
-        import traceback
-
-        traceback.print_exc()
+    if not upload_all(settings.tiktok, args.video, args.caption):
         sys.exit(1)
 
 
+def upload_all(config: TikTokConfig, videos: list[Path], caption: str) -> bool:
+    """Upload the videos in sequence; returns True if every upload succeeded.
+
+    Several videos share one browser session via TikTokClient.upload_batch.
+    They are not uploaded concurrently: TikTokClient toggles tiktok-uploader's
+    module-global config and writes fixed debug dump paths, so two clients in
+    one process would interfere with each other.
+    """
+    from tools.tiktok_client import TikTokClient
+
+    client = TikTokClient(config)
+    label = ", ".join(str(p) for p in videos)
+    print(f"Uploading {label} to TikTok...")
+    try:
+        if len(videos) == 1:
+            client.upload_single(videos[0], caption)
+        else:
+            client.upload_batch((p, caption) for p in videos)
+    except Exception:
+        logger.exception(f"❌ Upload failed ({label})")
+        return False
+    print(f"✅ Upload successful! ({label})")
+    return True
+
+
 if __name__ == "__main__":
     main()
 
@@ -1,35 +1,39 @@
 #!/usr/bin/env python3
 """Test script for YouTube uploads."""
 
+import argparse
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from loguru import logger
 
-from agent.config import Settings, YouTubeConfig
-from tools.youtube_client import YouTubeClient
-from tools.youtube_metadata import YouTubeMetadata
+from upload_inputs import check_videos
 
 
-def main() -> None:
-    """Test YouTube upload."""
-    import argparse
-
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line options for one YouTube test upload."""
     parser = argparse.ArgumentParser(description="Test YouTube upload")
-    parser.add_argument("--video", required=True, help="Path to video file")
+    parser.add_argument("--video", nargs="+", required=True, help="Path to video file(s)")
     parser.add_argument("--title", required=True, help="Video title")
     parser.add_argument("--description", default="", help="Video description")
     parser.add_argument("--tags", help="Comma-separated tags")
     parser.add_argument("--profile-dir", required=True, help="Path to Chrome profile directory")
     parser.add_argument("--headless", action="store_true", help="Run in headless mode")
+    return parser
 
-    args = parser.parse_args()
 
-    video_path = Path(args.video)
-    if not video_path.exists():
-        print(f"Error: Video file not found: {video_path}")
-        sys.exit(1)
+def main(argv: list[str] | None = None) -> None:
+    """Test YouTube upload."""
+    args = build_parser().parse_args(argv)
+
+    # Deferred so `--help` and argument errors skip the Selenium imports
+    from agent.config import Settings, YouTubeConfig
+    from tools.youtube_browser import build_chrome_for_youtube
+    from tools.youtube_client import YouTubeClient
+    from tools.youtube_metadata import YouTubeMetadata
+
+    video_paths = [Path(v) for v in args.video]
+    check_videos(video_paths)
 
     profile_dir = Path(args.profile_dir)
     if not profile_dir.exists():
@@ -52,17 +56,24 @@ def main() -> None:
         tags=tags,
     )
 
-    # Upload
+    # Upload. Chrome locks the profile directory, so videos go out one after
+    # another through a single browser session instead of one browser each.
+    client = YouTubeClient(settings.youtube)
+    driver = build_chrome_for_youtube(settings.youtube.profile_dir, settings.youtube.headless)
+    failed = 0
     try:
-        print(f"Uploading {video_path} to YouTube...")
-        client = YouTubeClient(settings.youtube)
-        video_id = client.upload_video(video_path, meta)
-        print(f"✅ Upload successful! Video ID: {video_id}")
-    except Exception as e:
-        print(f"❌ Upload failed: {e}")
-        import traceback
-
-        traceback.print_exc()
+        for video_path in video_paths:
+            try:
+                print(f"Uploading {video_path} to YouTube...")
+                video_id = client.upload_video(video_path, meta, driver=driver)
+                print(f"✅ Upload successful! Video ID: {video_id}")
+            except Exception:
+                logger.exception(f"❌ Upload failed ({video_path})")
+                failed += 1
+    finally:
+        driver.quit()
+
+    if failed:
         sys.exit(1)
 
 
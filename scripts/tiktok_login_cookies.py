@@ -15,15 +15,11 @@ Notes:
 from __future__ import annotations
 
 import argparse
-import sys
 from pathlib import Path
 from typing import Iterable
 
 from loguru import logger
 
-# Add src/ to path if executed directly
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from agent.config import TikTokConfig
 from tools.tiktok_browser import build_chrome_for_tiktok
 
@@ -34,18 +30,20 @@ def _netscape_dump(cookies: Iterable[dict], dest: Path) -> None:
     Format:
     domain<TAB>flag<TAB>path<TAB>secure<TAB>expiry<TAB>name<TAB>value
     """
-    lines = ["# Netscape HTTP Cookie File"]
-    for c in cookies:
-        domain = c.get("domain", "")
-        flag = "TRUE" if domain.startswith(".") else "FALSE"
-        path = c.get("path", "/")
-        secure = "TRUE" if c.get("secure", False) else "FALSE"
-        expiry = str(int(c.get("expiry", 0))) if c.get("expiry") is not None else "0"
-        name = c.get("name", "")
-        value = c.get("value", "")
-        lines.append("\t".join([domain, flag, path, secure, expiry, name, value]))
-
-    dest.write_text("\n".join(lines))
+    # Stream rows straight to the file; no intermediate list or joined blob
+    with dest.open("w") as fh:
+        fh.write("# Netscape HTTP Cookie File\n")
+        for c in cookies:
+            domain = c.get("domain", "")
+            flag = "TRUE" if domain.startswith(".") else "FALSE"
+            path = c.get("path", "/")
+            secure = "TRUE" if c.get("secure", False) else "FALSE"
+            expiry = c.get("expiry")
+            expiry = str(int(expiry)) if expiry is not None else "0"
+            name = c.get("name", "")
+            value = c.get("value", "")
+            fh.write("\t".join((domain, flag, path, secure, expiry, name, value)) + "\n")
+
     logger.info("[TIKTOK] Saved cookies to {}", dest)
 
 
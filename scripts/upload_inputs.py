@@ -0,0 +1,24 @@
+"""Input checks shared by the test_*_upload scripts."""
+
+import stat
+import sys
+from pathlib import Path
+from typing import Iterable
+
+
+def check_videos(video_paths: Iterable[Path]) -> None:
+    """Exit with an error unless every path is a non-empty regular file.
+
+    One stat per file: a regular file (not a directory) with a non-empty size.
+    """
+    for video_path in video_paths:
+        try:
+            st = video_path.stat()
+        except FileNotFoundError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            print(f"Error: Video file not found: {video_path}")
+            sys.exit(1)
+        if not st.st_size:
+            print(f"Error: Video file is empty: {video_path}")
+            sys.exit(1)
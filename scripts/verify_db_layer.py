@@ -2,19 +2,21 @@
 """Verify DB layer functionality."""
 
 import sys
-from pathlib import Path
 from datetime import datetime, timedelta
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from agent.db.base import SessionLocal
 from agent.services.assets import AssetService
 from agent.services.publishing_runs import PublishingRunService
 from agent.db.models import Account
 
-def verify():
-    session = SessionLocal()
+def verify(session=None) -> bool:
+    """Run the checks on ``session``, or on a fresh session closed afterwards.
+
+    Returns True if every check passed.
+    """
+    owns_session = session is None
+    if owns_session:
+        session = SessionLocal()
     try:
         print("1. Verifying Accounts...")
         # Should have at least the migrated account 'accounts' (from the previous step's output)
@@ -65,6 +67,7 @@ def verify():
             print("   -> SUCCESS: Created run was found in pending list.")
         else:
             print("   -> FAILURE: Created run not found in pending list.")
+            return False
 
         print("\n6. Cleaning up...")
         # Optional: delete test data
@@ -72,13 +75,16 @@ def verify():
         # session.delete(asset)
         # session.commit()
         print("   -> Test complete.")
+        return True
 
     except Exception as e:
         print(f"VERIFICATION FAILED: {e}")
         import traceback
         traceback.print_exc()
+        return False
     finally:
-        session.close()
+        if owns_session:
+            session.close()
 
 if __name__ == "__main__":
-    verify()
+    sys.exit(0 if verify() else 1)
@@ -1,15 +1,10 @@
 
-import sys
-import os
 from pathlib import Path
 
-# Add src to path
-sys.path.append(os.path.join(os.getcwd(), "src"))
-
 from dotenv import load_dotenv
 from loguru import logger
 from agent.config import load_settings
-from tools.gologin_selenium import SyncGoLoginWebDriver
+from tools.gologin_selenium import get_or_launch
 
 def main():
     load_dotenv()
@@ -27,15 +22,14 @@ def main():
     logger.info(f"Found credentials: Profile ID {profile_id}")
     
     try:
-        logger.info("Initializing SyncGoLoginWebDriver...")
-        with SyncGoLoginWebDriver(token, profile_id) as driver:
-            logger.info("Driver launched successfully!")
-            driver.get("https://ipinfo.io/json")
-            logger.info(f"Page title: {driver.title}")
-            content = driver.find_element("tag name", "pre").text
-            logger.info(f"IP Info: {content}")
-            
-        logger.info("Driver closed successfully.")
+        logger.info("Launching (or reusing) GoLogin profile...")
+        # Warm session is cached per profile and stopped at interpreter exit
+        driver = get_or_launch(token, profile_id)
+        logger.info("Driver launched successfully!")
+        driver.get("https://ipinfo.io/json")
+        logger.info(f"Page title: {driver.title}")
+        content = driver.find_element("tag name", "pre").text
+        logger.info(f"IP Info: {content}")
         
     except Exception as e:
         logger.exception(f"Verification failed: {e}")
@@ -2,33 +2,52 @@ import sqlite3
 import os
 
 db_path = "social_agent.db"
-conn = sqlite3.connect(db_path)
+# Read-only, autocommit: no journal or write transaction is ever set up
+conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, isolation_level=None)
 c = conn.cursor()
 
-def check(condition, msg):
-    if condition:
-        print(f"PASS: {msg}")
-    else:
-        print(f"FAIL: {msg}")
-        exit(1)
+# SQLite stores booleans as 1/0 integers usually, but literal default 'true' might be string
+_TRUTHY = frozenset((1, True, 'true', '1'))
+
+
+def report(checks):
+    """Print each (ok, message) check in order; exit at the first failure."""
+    for ok, msg in checks:
+        print(f"{'PASS' if ok else 'FAIL'}: {msg}")
+        if not ok:
+            exit(1)
 
 try:
-    # 1. Users
-    c.execute("SELECT count(*) FROM users WHERE email='admin@example.com'")
-    count = c.fetchone()[0]
-    check(count == 1, "Admin user exists")
+    # All row counts in one statement
+    c.execute("""
+        SELECT
+            (SELECT count(*) FROM users WHERE email='admin@example.com'),
+            (SELECT count(*) FROM platforms),
+            (SELECT count(*) FROM dummy_accounts),
+            (SELECT count(*) FROM assets)
+    """)
+    users, platforms, dummy_accounts, assets = c.fetchone()
 
-    # 2. Platforms
-    c.execute("SELECT count(*) FROM platforms")
-    count = c.fetchone()[0]
-    check(count == 3, "Platforms seeded (3)")
+    # Counts first: the sample-row checks below read rows that only exist once
+    # these pass
+    report([
+        (users == 1, "Admin user exists"),
+        (platforms == 3, "Platforms seeded (3)"),
+        (dummy_accounts == 1, "Dummy accounts migrated (1)"),
+        (assets == 1, "Assets migrated (1)"),
+    ])
 
-    # 3. Dummy Accounts (Legacy migration)
-    c.execute("SELECT count(*) FROM dummy_accounts")
-    count = c.fetchone()[0]
-    check(count == 1, "Dummy accounts migrated (1)")
-    
-    c.execute("SELECT username, platform_id, is_active FROM dummy_accounts LIMIT 1")
+    # Both sample rows in one statement. Selecting da.config doubles as the
+    # schema check that the JSON column exists (SQLite returns text for JSON).
+    # LEFT JOINs from a one-row base always yield a row: an empty table gives
+    # NULLs for its columns instead of no row.
+    c.execute("""
+        SELECT da.username, da.platform_id, da.is_active, da.config,
+               a.original_name, a.user_id, a.campaign_id, a.deleted_by_user_id
+        FROM (SELECT 1)
+        LEFT JOIN (SELECT * FROM dummy_accounts LIMIT 1) da ON 1
+        LEFT JOIN (SELECT * FROM assets LIMIT 1) a ON 1
+    """)
     row = c.fetchone()
     # Migration set username = name because primary_contact_email was 'test@example.com'.
     # Update logic: SET username = name WHERE username IS NULL.
@@ -38,27 +57,16 @@ try:
     # So username should be 'test@example.com'.
     # Then I did: UPDATE dummy_accounts SET username = name WHERE username IS NULL.
     # If username is NOT null, it stays 'test@example.com'.
-    check(row[0] == 'test@example.com', f"Username preserved as email (Got: {row[0]})")
-    check(row[1] == 1, "Platform ID defaulted to 1 (Instagram)")
-    # SQLite stores booleans as 1/0 integers usually, but literal default 'true' might be string
-    check(row[2] in (1, True, 'true', '1'), f"is_active defaulted to true (Got: {row[2]!r})")
 
-    # 4. Assets
-    c.execute("SELECT count(*) FROM assets")
-    count = c.fetchone()[0]
-    check(count == 1, "Assets migrated (1)")
-    
-    c.execute("SELECT original_name, user_id, campaign_id, deleted_by_user_id FROM assets LIMIT 1")
-    row = c.fetchone()
-    check(row[0] == 'test_video.mp4', f"Original name preserved (Got: {row[0]})")
-    check(row[1] == 1, "User ID set to Admin")
-    check(row[2] == 1, "Campaign ID set to Default Legacy")
-    
-    # 5. Schema Check (JSON Column)
-    # SQLite returns text for JSON.
-    c.execute("SELECT config FROM dummy_accounts")
-    # Should be null or something
-    
+    report([
+        (row[0] == 'test@example.com', f"Username preserved as email (Got: {row[0]})"),
+        (row[1] == 1, "Platform ID defaulted to 1 (Instagram)"),
+        (row[2] in _TRUTHY, f"is_active defaulted to true (Got: {row[2]!r})"),
+        (row[4] == 'test_video.mp4', f"Original name preserved (Got: {row[4]})"),
+        (row[5] == 1, "User ID set to Admin"),
+        (row[6] == 1, "Campaign ID set to Default Legacy"),
+    ])
+
     print("ALL CHECKS PASSED")
 
 except Exception as e:
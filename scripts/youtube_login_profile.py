@@ -1,12 +1,8 @@
 #!/usr/bin/env python3
 """Script to create a logged-in YouTube Chrome profile."""
 
-import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from tools.youtube_browser import build_chrome_for_youtube
 
 
@@ -4,14 +4,8 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 
-from loguru import logger
-
-from agent.config import load_settings
-from agent.workflow import VideoItem, run_cycle
-
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Social agent CLI")
@@ -42,6 +36,12 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    # Deferred so `--help` and argument errors skip the workflow/uploader imports
+    from loguru import logger
+
+    from agent.config import load_settings
+    from agent.workflow import VideoItem, run_cycle
+
     if not args.video.exists():
         raise SystemExit(f"Video file not found: {args.video}")
 
@@ -52,7 +52,9 @@ def main() -> None:
     platforms = [p.strip() for p in args.platforms.split(",") if p.strip()]
 
     if args.meta:
-        captions = json.loads(args.meta.read_text())
+        import orjson
+
+        captions = orjson.loads(args.meta.read_bytes())
     else:
         captions = {
             "tiktok": "Test TikTok upload",
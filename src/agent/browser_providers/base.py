@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
+import os
+import re
+import socket
+import struct
 from dataclasses import dataclass
-from typing import Protocol, Optional, Mapping, Any
+from urllib.parse import urlparse
+from typing import Protocol, Optional, Mapping, Any, Iterator, Sequence, Union
+
+import urllib3
+from urllib3.connection import HTTPConnection
 
 class BrowserProviderError(Exception):
     def __init__(self, msg: str, code: Optional[str] = None, provider: Optional[str] = None):
@@ -41,3 +51,140 @@ class BrowserProvider(Protocol):
     ) -> None:
         """Tear down or release the underlying session/container if applicable."""
         ...
+
+
+def poll_intervals(initial: float = 0.1, factor: float = 1.5, cap: float = 1.0) -> Iterator[float]:
+    """Sleep intervals for readiness polling: start at `initial`, grow by `factor` up to `cap`.
+
+    Pair with a time.monotonic() deadline so the overall timeout does not depend
+    on how many polls fit in it.
+    """
+    interval = initial
+    while True:
+        yield interval
+        interval = min(interval * factor, cap)
+
+
+# Anything but "-" and word characters; for any Unicode input, \w is exactly
+# str.isalnum() or "_"
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w-]")
+
+
+def sanitize_name(account_name: str) -> str:
+    """Strip an account name down to characters usable in container names and paths."""
+    return _UNSAFE_NAME_CHARS.sub("", account_name)
+
+
+# next() on a count is atomic under the GIL, so concurrent starts never share a value
+_name_counter = itertools.count()
+
+
+def unique_suffix() -> str:
+    """Container-name suffix `<pid>-<n>`, distinct for every start by any worker on the host.
+
+    The pid is read per call rather than at import so forked workers differ.
+    """
+    return f"{os.getpid()}-{next(_name_counter)}"
+
+
+# SO_LINGER with l_onoff=1, l_linger=0: close() sends RST, so the probing side
+# never holds the socket in TIME_WAIT while sessions churn
+SO_LINGER_RESET = struct.pack("ii", 1, 0)
+
+
+def is_port_open(host: str, port: int, timeout: float = 0.5) -> bool:
+    """TCP connect probe for readiness polling; the probe socket is reset on close."""
+    try:
+        with socket.create_connection((host, port), timeout=timeout) as s:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, SO_LINGER_RESET)
+            return True
+    except OSError:
+        return False
+
+
+# urllib3's defaults already set TCP_NODELAY; keep-alive lets repeated /status
+# polls reuse one connection instead of a fresh handshake per poll, and
+# SO_LINGER=0 keeps closed probe connections out of TIME_WAIT
+_PROBE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    (socket.SOL_SOCKET, socket.SO_LINGER, SO_LINGER_RESET),
+]
+# A port nobody listens on fails within the connect timeout; the read timeout
+# covers a server that accepted but is not answering yet
+_PROBE_TIMEOUT = urllib3.Timeout(connect=0.3, read=1.0)
+_PROBE_POOL = urllib3.PoolManager(maxsize=4, retries=False, socket_options=_PROBE_SOCKET_OPTIONS)
+
+
+def probe_webdriver(webdriver_url: str) -> Optional[str]:
+    """Return None once `{webdriver_url}/status` answers 200, else why not.
+
+    One HTTP request per poll; no separate TCP connect check first (Docker's
+    port proxy accepts connections before anything in the container listens).
+    """
+    try:
+        response = _PROBE_POOL.request("GET", f"{webdriver_url}/status", timeout=_PROBE_TIMEOUT)
+    except urllib3.exceptions.ConnectTimeoutError as e:
+        # Refused, unreachable or slow to connect (NewConnectionError is a subclass)
+        return f"not listening: {e}"
+    except urllib3.exceptions.ReadTimeoutError:
+        return "listening but not answering /status yet"
+    except urllib3.exceptions.HTTPError as e:
+        # e.g. the port proxy resetting the connection before the container binds
+        return f"{type(e).__name__}: {e}"
+    if response.status == 200:
+        return None
+    return f"HTTP {response.status}"
+
+
+def docker_host_address(default: str) -> str:
+    """Host that published container ports are reachable on, per DOCKER_HOST.
+
+    tcp:// and ssh:// daemons publish ports on their own host; for unix://
+    (or no DOCKER_HOST) the ports are local and `default` is returned.
+    """
+    parsed = urlparse(os.environ.get("DOCKER_HOST", ""))
+    if parsed.scheme in ("tcp", "ssh") and parsed.hostname:
+        return parsed.hostname
+    return default
+
+
+def container_logs(container: Any, tail: int) -> str:
+    """Last `tail` lines of a container's output, or why they could not be read."""
+    try:
+        return container.logs(tail=tail).decode("utf-8", errors="replace").rstrip("\n")
+    except Exception as e:
+        return f"Failed to retrieve logs: {e}"
+
+
+def discard_container(container: Any) -> None:
+    """Kill and delete a container in one API call, ignoring errors.
+
+    Used on failed starts, after any logs wanted for the error were read.
+    """
+    try:
+        container.remove(force=True)
+    except Exception:
+        # Already gone
+        pass
+
+
+async def start_sessions(
+    provider: BrowserProvider,
+    profile_rows: Sequence[Any],
+    *,
+    trace_id: str,
+) -> list[Union[BrowserSession, BaseException]]:
+    """Start one session per profile concurrently; N starts take about as long as the slowest.
+
+    start_session blocks (Docker API calls, readiness polling), so each start
+    runs in a worker thread. Results are in profile order; a failed start is
+    returned as its exception rather than raised, so the caller still gets the
+    sessions that did start and can stop them.
+    """
+    return await asyncio.gather(
+        *(
+            asyncio.to_thread(provider.start_session, profile_row, trace_id=f"{trace_id}-{i}")
+            for i, profile_row in enumerate(profile_rows)
+        ),
+        return_exceptions=True,
+    )
@@ -1,20 +1,44 @@
 from __future__ import annotations
 
 import os
+import threading
 from typing import Optional, Mapping, Any
-from datetime import datetime
 from loguru import logger
 
 from agent.browser_providers.base import BrowserProvider, BrowserSession, BrowserProviderError
 from tools.gologin_selenium import SyncGoLoginWebDriver
 from agent.config import load_settings
 
+# (substring of the lowercased error message, error code), checked in order
+_ERROR_CODES = (
+    ("limit", "GOLOGIN_LIMIT_REACHED"),
+    ("429", "GOLOGIN_API_429"),
+    ("banned", "GOLOGIN_PROFILE_BANNED"),
+)
+
 class GoLoginProvider(BrowserProvider):
     code = "GOLOGIN"
     
     def __init__(self):
         self.settings = load_settings()
 
+        # Token lookups for start_session, resolved once: account name -> token
+        # (first configured GoLogin account wins, as in get_gologin_credentials),
+        # plus the first token overall as the fallback.
+        self._tokens_by_account: dict[str, str] = {}
+        for config in self.settings.gologin_accounts.values():
+            for account_name in config.profiles:
+                self._tokens_by_account.setdefault(account_name, config.token)
+        self._default_token = next(
+            (config.token for config in self.settings.gologin_accounts.values()), None
+        )
+
+        # Running wrappers by provider_session_ref (the GoLogin profile id), so
+        # stop_session can stop the Orbita process that start_session launched.
+        # None marks a profile whose start is still in progress.
+        self._active: dict[str, Optional[SyncGoLoginWebDriver]] = {}
+        self._active_lock = threading.Lock()
+
     def start_session(
         self,
         profile_row: Any,
@@ -45,24 +69,26 @@ class GoLoginProvider(BrowserProvider):
             # The current system (pre-refactor) passed credentials manually.
             # Let's assume we REQUIRE the token to be passed in 'extra' or found in settings via dummy account name.
             
-            account_name = profile_row.dummy_account.name
-            creds = self.settings.get_gologin_credentials(account_name)
-            if creds:
-                account_token = creds[0]
-            else:
-                 # Last resort: Try use token from environment if single user
-                 # This is tricky without changing DB.
-                 pass
+            account_token = self._tokens_by_account.get(profile_row.dummy_account.name)
 
         if not account_token:
              # Try first token from settings as fallback
-             values = list(self.settings.gologin_accounts.values())
-             if values:
-                 account_token = values[0].token
+             account_token = self._default_token
         
         if not account_token:
             raise BrowserProviderError("No GoLogin token available", code="GOLOGIN_AUTH_FAILED", provider=self.code)
 
+        # One session per profile: a second start would replace the registered
+        # wrapper and leak the first Orbita process, so refuse it instead
+        with self._active_lock:
+            if profile_id in self._active:
+                raise BrowserProviderError(
+                    f"GoLogin profile {profile_id} already has a running session",
+                    code="GOLOGIN_PROFILE_IN_USE",
+                    provider=self.code,
+                )
+            self._active[profile_id] = None
+
         try:
             logger.info(f"[{trace_id}] Starting GoLogin profile {profile_id}")
             # This class (SyncGoLoginWebDriver) starts the driver in __enter__ usually.
@@ -96,7 +122,9 @@ class GoLoginProvider(BrowserProvider):
             # Yes, standard Selenium can attach to an existing debugger address.
             
             # Let's start the wrapper.
-            driver = driver_wrapper.start_driver() # Assume we can verify/add this method to the wrapper
+            driver = driver_wrapper.start_driver()
+            with self._active_lock:
+                self._active[profile_id] = driver_wrapper
             
             # Extract info
             # The driver is running.
@@ -128,14 +156,10 @@ class GoLoginProvider(BrowserProvider):
             # OR we actually start a local webdriver session and return the executor URL 
             # (driver.command_executor._url).
             
-            debug_port = driver_wrapper.gl.debugger_address  # This is usually host:port
             executor_url = driver.command_executor._url # This is the WebDriver API endpoint!
             
-            # Successful start
-            
-            # Update last used
-            # profile_row.last_used_at = datetime.utcnow() # Caller or Allocator handles DB save?
-            
+            # Successful start (the allocator records profile_row.last_used_at)
+
             return BrowserSession(
                 provider_code=self.code,
                 provider_profile_id=profile_row.id,
@@ -146,15 +170,19 @@ class GoLoginProvider(BrowserProvider):
             )
 
         except Exception as e:
+            # Release the profile; stop the browser if it started before the failure
+            with self._active_lock:
+                started = self._active.pop(profile_id, None)
+            if started is not None:
+                try:
+                    started.stop_driver()
+                except Exception as stop_err:
+                    logger.warning(f"[{trace_id}] Failed to stop GoLogin profile {profile_id}: {stop_err}")
+
             error_msg = str(e)
-            code = "GOLOGIN_UNKNOWN"
-            if "limit" in error_msg.lower():
-                code = "GOLOGIN_LIMIT_REACHED"
-            elif "429" in error_msg:
-                code = "GOLOGIN_API_429"
-            elif "banned" in error_msg.lower():
-                code = "GOLOGIN_PROFILE_BANNED"
-            
+            lowered = error_msg.lower()
+            code = next((code for needle, code in _ERROR_CODES if needle in lowered), "GOLOGIN_UNKNOWN")
+
             raise BrowserProviderError(error_msg, code=code, provider=self.code)
 
     def stop_session(
@@ -163,17 +191,14 @@ class GoLoginProvider(BrowserProvider):
         *,
         trace_id: str,
     ) -> None:
-        # We need to find the running driver associated with session and close it.
-        # Since we don't hold state here, we might rely on the fact that
-        # the 'driver' object needs to be closed by the consumer OR
-        # we store a registry of active sessions in memory?
-        
-        # For a robust backend, we should track active sessions.
-        # But for this iteration, if the consumer closes the driver, we are good.
-        # However, GoLogin often leaves orbita browser processes if not cleanly stopped via API.
-        
+        # GoLogin often leaves Orbita processes behind if not cleanly stopped via API,
+        # so stop the wrapper start_session registered rather than relying on the consumer.
+        with self._active_lock:
+            driver_wrapper = self._active.pop(session.provider_session_ref, None)
+
+        if driver_wrapper is None:
+            logger.warning(f"[{trace_id}] No running GoLogin session {session.provider_session_ref} to stop")
+            return
+
         logger.info(f"[{trace_id}] Stopping GoLogin session {session.provider_session_ref}")
-        
-        # Ideally we call GL API to stop if needed, or kill process.
-        # Use existing tools.gologin_selenium logic if possible.
-        pass
+        driver_wrapper.stop_driver()
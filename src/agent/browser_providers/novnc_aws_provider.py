@@ -2,27 +2,65 @@ from __future__ import annotations
 
 import os
 import time
-import socket
+from functools import cached_property
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import docker
 import json
 from typing import Optional, Mapping, Any
 from loguru import logger
 
-from agent.browser_providers.base import BrowserProvider, BrowserSession, BrowserProviderError
+from agent.browser_providers.base import (
+    BrowserProvider, BrowserSession, BrowserProviderError, container_logs,
+    docker_host_address, discard_container, poll_intervals, probe_webdriver, sanitize_name,
+    unique_suffix,
+)
 from agent.config import load_settings
 
+# Seconds between container inspects once the WebDriver port is published
+_CRASH_CHECK_SECS = 5.0
+
+# One pull per image per process, shared by every provider instance (the
+# allocator builds several, and every client targets the same DOCKER_HOST):
+# the first start for an image pulls it if missing, concurrent starts for the
+# same image wait instead of pulling again
+_image_ready: dict[str, threading.Event] = {}
+_image_lock = threading.Lock()
+# Images whose NOVNC_IMAGE_URI pre-pull has been started in this process
+_prepull_started: set[str] = set()
+
 class NovncAwsProvider(BrowserProvider):
     code = "NOVNC_AWS"
 
     def __init__(self):
-        self.settings = load_settings()
-        # Initialize Docker Client
-        # We respect DOCKER_HOST env var automatically
+        # Settings and the Docker client are created on first use (see below),
+        # so constructing the provider does no I/O
+
+        # Container removal runs here so stop_session returns immediately
+        self._reaper = ThreadPoolExecutor(max_workers=8, thread_name_prefix="novnc-aws-reaper")
+
+        # The env image overrides provider config, so it can be warmed up front
+        # (once per process, however many providers are built)
+        env_image = os.environ.get("NOVNC_IMAGE_URI")
+        if env_image:
+            with _image_lock:
+                first = env_image not in _prepull_started
+                _prepull_started.add(env_image)
+            if first:
+                threading.Thread(target=self._prepull_image, args=(env_image,), daemon=True).start()
+
+    @cached_property
+    def settings(self):
+        return load_settings()
+
+    @cached_property
+    def client(self) -> Optional[docker.DockerClient]:
+        """Docker client, created on first use; we respect DOCKER_HOST env var automatically."""
         try:
-            self.client = docker.from_env()
+            return docker.from_env()
         except Exception as e:
-            self.client = None
             logger.warning(f"Docker client initialization failed: {e}")
+            return None
 
     def start_session(
         self,
@@ -46,8 +84,8 @@ class NovncAwsProvider(BrowserProvider):
         
         # 2. Start Container
         account_name = profile_row.dummy_account.name
-        safe_name = "".join(c for c in account_name if c.isalnum() or c in ('-','_'))
-        container_name = f"novnc-aws-{safe_name}-{trace_id[-6:]}-{int(time.time())}"
+        safe_name = sanitize_name(account_name)
+        container_name = f"novnc-aws-{safe_name}-{trace_id[-6:]}-{unique_suffix()}"
         
         # We typically map:
         # 6080 -> random (for vnc viewing if debug needed)
@@ -70,6 +108,8 @@ class NovncAwsProvider(BrowserProvider):
              pass
 
         try:
+            self._ensure_image(image, trace_id)
+
             logger.info(f"[{trace_id}] Starting {self.code} container {container_name} ({image})")
             container = self.client.containers.run(
                 image,
@@ -84,87 +124,71 @@ class NovncAwsProvider(BrowserProvider):
             )
             
             # 3. Wait for Readiness
-            container.reload()
+            # One loop covers both stages: Docker publishing the port mapping, then
+            # ChromeDriver answering /status (Docker reports "running" and ports
+            # mapped before the process inside has bound). The overall budget is
+            # unchanged (30s + 60s), but each poll advances whichever stage is next.
+            # The first iteration's reload is the first inspect after run.
+            target_host = self._docker_host
             host_wd_port = None
             host_vnc_port = None
-            
-            retries = 30
-            while retries > 0:
-                container.reload()
-                if container.status not in ['running', 'created']:
-                    logs = container.logs().decode('utf-8')[-200:]
-                    raise BrowserProviderError(f"Container exited: {logs}", code="NOVNC_AWS_CRASH", provider=self.code)
-                
+            webdriver_url = None
+            ready = False
+            last_error = None
+            start_wait = time.monotonic()
+            deadline = start_wait + 90
+            delays = poll_intervals()
+            attempt = 0
+            next_inspect = start_wait
+
+            while time.monotonic() < deadline:
+                attempt += 1
+                # Inspect on every poll until the WebDriver port is published. After
+                # that the mapping is fixed and the inspect only catches a crashed
+                # container (whose probes fail anyway), so it runs every few seconds.
+                now = time.monotonic()
+                if not host_wd_port or now >= next_inspect:
+                    container.reload()
+                    next_inspect = now + _CRASH_CHECK_SECS
+                    if container.status not in ['running', 'created']:
+                        logs = container_logs(container, tail=20)[-200:]
+                        discard_container(container)
+                        raise BrowserProviderError(f"Container exited: {logs}", code="NOVNC_AWS_CRASH", provider=self.code)
+
                 # Check ports
-                p_wd = container.ports.get(f"{internal_port}/tcp")
-                p_vnc = container.ports.get("7900/tcp") or container.ports.get("6080/tcp")
-                
-                if p_wd:
-                    host_wd_port = p_wd[0]['HostPort']
-                    
-                    # Resolve Host IP
-                    target_host = self._resolve_docker_host()
-                    
-                    # Check Socket
-                    if self._is_port_open(target_host, int(host_wd_port)):
-                        if p_vnc:
-                            host_vnc_port = p_vnc[0]['HostPort']
+                if not host_wd_port:
+                    p_wd = container.ports.get(f"{internal_port}/tcp")
+                    if p_wd:
+                        host_wd_port = p_wd[0]['HostPort']
+                        webdriver_url = f"http://{target_host}:{host_wd_port}/wd/hub"
+                        logger.info(f"[{trace_id}] Waiting for WebDriver readiness at {webdriver_url}...")
+
+                # Ask ChromeDriver itself
+                if host_wd_port:
+                    last_error = self._probe_webdriver(webdriver_url)
+                    if last_error is None:
+                        # noVNC only renders a debug URL: take its port if mapped, never wait for it
+                        p_vnc = container.ports.get("7900/tcp") or container.ports.get("6080/tcp") or [{}]
+                        host_vnc_port = p_vnc[0].get('HostPort')
+                        logger.info(f"[{trace_id}] WebDriver ready in {time.monotonic() - start_wait:.1f}s")
+                        ready = True
                         break
-                        
-                time.sleep(1)
-                retries -= 1
-                
+                    # Log only periodically to avoid spam
+                    if attempt % 10 == 1:
+                        logger.debug(f"[{trace_id}] Waiting for WebDriver... ({last_error})")
+
+                time.sleep(next(delays))
+
             if not host_wd_port:
-                container.stop()
-                container.remove()
+                discard_container(container)
                 raise BrowserProviderError("Timed out waiting for WebDriver port", code="NOVNC_AWS_TIMEOUT", provider=self.code)
 
-            target_host = self._resolve_docker_host()
-            
-            # Construct URLs
-            webdriver_url = f"http://{target_host}:{host_wd_port}/wd/hub"
-            
-            # Wait for ChromeDriver to be ready
-            # Docker reports "Running" and ports mapped, but process inside needs time to bind
-            import urllib.request
-            import urllib.error
-            
-            logger.info(f"[{trace_id}] Waiting for WebDriver readiness at {webdriver_url}...")
-            ready = False
-            last_error = None
-            start_wait = time.time()
-            
-            for i in range(60): # Retry for 60 seconds
-                try:
-                    # Check status endpoint with increased timeout (3s) to handle initial latency
-                    with urllib.request.urlopen(f"{webdriver_url}/status", timeout=3) as response:
-                        if response.status == 200:
-                            elapsed = time.time() - start_wait
-                            logger.info(f"[{trace_id}] WebDriver ready in {elapsed:.1f}s")
-                            ready = True
-                            break
-                        else:
-                            last_error = f"HTTP {response.status}"
-                except (OSError, urllib.error.URLError) as e:
-                    # Capture exact error for debugging (ConnectionRefused vs Timeout vs no route)
-                    last_error = f"{type(e).__name__}: {e}"
-                    # Log only periodically to avoid spam, or on final attempt
-                    if i % 10 == 0 or i == 59:
-                         logger.debug(f"[{trace_id}] Waiting for WebDriver... ({last_error})")
-                    time.sleep(1)
-            
             if not ready:
-                logs = "No logs available"
-                try:
-                    full_log = container.logs().decode('utf-8')
-                    logs = "\n".join(full_log.splitlines()[-50:]) # Capture last 50 lines
-                except Exception as log_err:
-                    logs = f"Failed to retrieve logs: {log_err}"
-                
+                # Capture last 50 lines (trimmed by the daemon, not after downloading everything)
+                logs = container_logs(container, tail=50)
                 logger.error(f"Container logs for failed verification:\n{logs}")
                 
-                container.stop()
-                container.remove()
+                discard_container(container)
                 raise BrowserProviderError(f"Timed out waiting for ChromeDriver readiness. Last error: {last_error}. Container logs: {logs[:500]}...", code="NOVNC_AWS_TIMEOUT", provider=self.code)
 
             novnc_url = None
@@ -179,6 +203,8 @@ class NovncAwsProvider(BrowserProvider):
                 novnc_url=novnc_url
             )
 
+        except BrowserProviderError:
+             raise
         except docker.errors.APIError as e:
              raise BrowserProviderError(f"Docker API Error: {e}", code="NOVNC_AWS_DOCKER_ERROR", provider=self.code)
         except Exception as e:
@@ -189,28 +215,65 @@ class NovncAwsProvider(BrowserProvider):
         session: BrowserSession,
         *,
         trace_id: str,
+        wait: bool = False,
     ) -> None:
+        """Remove the session's container in the background; `wait=True` blocks until done."""
         if not self.client: return
         cid = session.provider_session_ref
+        logger.info(f"[{trace_id}] Stopping {self.code} container {cid[:8]}")
+        future = self._reaper.submit(self._remove_container, cid, trace_id)
+        if wait:
+            future.result()
+
+    def _remove_container(self, cid: str, trace_id: str) -> None:
+        # Nothing in the container needs a graceful shutdown (the browser profile is
+        # not persisted), so skip stop()'s SIGTERM grace period: force-remove kills
+        # and deletes in one API call
         try:
-             logger.info(f"[{trace_id}] Stopping {self.code} container {cid[:8]}")
-             c = self.client.containers.get(cid)
-             c.stop(timeout=5)
-             c.remove()
+            self.client.containers.get(cid).remove(force=True)
         except docker.errors.NotFound:
             pass
         except Exception as e:
             logger.error(f"Error stopping container {cid}: {e}")
 
-    def _resolve_docker_host(self) -> str:
-        d_host = os.environ.get("DOCKER_HOST")
-        if d_host and "tcp://" in d_host:
-             return d_host.split("://")[1].split(":")[0]
-        return "127.0.0.1"
+    def _ensure_image(self, image: str, trace_id: str) -> None:
+        """Make sure `image` is present locally before containers.run, pulling at most once."""
+        with _image_lock:
+            event = _image_ready.get(image)
+            owner = event is None
+            if owner:
+                event = _image_ready[image] = threading.Event()
+
+        if not owner:
+            event.wait()
+            return
+
+        try:
+            try:
+                self.client.images.get(image)
+            except docker.errors.ImageNotFound:
+                logger.info(f"[{trace_id}] Pulling {image}")
+                self.client.images.pull(image)
+        except Exception:
+            # Forget the attempt so a later start retries the pull
+            with _image_lock:
+                _image_ready.pop(image, None)
+            raise
+        finally:
+            event.set()
 
-    def _is_port_open(self, host, port):
+    def _prepull_image(self, image: str) -> None:
+        if not self.client:
+            return
         try:
-            with socket.create_connection((host, port), timeout=0.5):
-                return True
-        except (socket.timeout, ConnectionRefusedError, OSError):
-            return False
+            self._ensure_image(image, "prepull")
+        except Exception as e:
+            logger.warning(f"Pre-pull of {image} failed: {e}")
+
+    @cached_property
+    def _docker_host(self) -> str:
+        """DOCKER_HOST's host, parsed on first use and kept for the provider's lifetime."""
+        return docker_host_address("127.0.0.1")
+
+    def _probe_webdriver(self, webdriver_url: str) -> Optional[str]:
+        return probe_webdriver(webdriver_url)
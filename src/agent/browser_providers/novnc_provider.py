@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import os
 import time
-import socket
 import docker
 from typing import Optional, Mapping, Any
 from datetime import datetime
 from loguru import logger
 
-from agent.browser_providers.base import BrowserProvider, BrowserSession, BrowserProviderError
+from agent.browser_providers.base import (
+    BrowserProvider, BrowserSession, BrowserProviderError, container_logs, is_port_open,
+    discard_container, poll_intervals, sanitize_name,
+)
 
 class NoVNCProvider(BrowserProvider):
     code = "NOVNC"
@@ -36,7 +38,7 @@ class NoVNCProvider(BrowserProvider):
             raise BrowserProviderError("Docker not available", code="NOVNC_DOCKER_ERROR", provider=self.code)
             
         account_name = profile_row.dummy_account.name
-        safe_name = "".join(c for c in account_name if c.isalnum() or c in ('-','_'))
+        safe_name = sanitize_name(account_name)
         container_name = f"novnc-{safe_name}-{trace_id[-6:]}"
         
         # Ports mapping
@@ -75,18 +77,22 @@ class NoVNCProvider(BrowserProvider):
                 shm_size='2g' # Important for Chrome
             )
             
-            # Wait for ports and readiness
-            container.reload() # Get mapped ports
-            
+            # Wait for ports and readiness (each poll reloads to get mapped ports)
             # Simple polling wait
-            retries = 20
+            deadline = time.monotonic() + 20
+            delays = poll_intervals()
+            # Connect timeout per probe: short while ChromeDriver is still starting
+            # (a failed probe then costs ~50ms, not 1s), widening towards 0.5s
+            connect_timeouts = poll_intervals(initial=0.05, cap=0.5)
             webdriver_port = None
             novnc_port = None
             
-            while retries > 0:
+            while time.monotonic() < deadline:
                 container.reload()
                 if container.status != 'running':
-                    raise BrowserProviderError(f"Container died: {container.logs().decode('utf-8')}", code="NOVNC_CRASH", provider=self.code)
+                    logs = container_logs(container, tail=20)
+                    discard_container(container)
+                    raise BrowserProviderError(f"Container died: {logs}", code="NOVNC_CRASH", provider=self.code)
                 
                 # Check mapping
                 # Ports format: {'6080/tcp': [{'HostIp': '0.0.0.0', 'HostPort': '32768'}], ...}
@@ -98,16 +104,14 @@ class NoVNCProvider(BrowserProvider):
                     novnc_port = p_vnc[0]['HostPort']
                     
                     # Try connecting to webdriver port socket to ensure it's listening
-                    if self._is_port_open('localhost', int(webdriver_port)):
+                    if self._is_port_open('localhost', int(webdriver_port), next(connect_timeouts)):
                         break
                 
-                time.sleep(1)
-                retries -= 1
+                time.sleep(next(delays))
             
             if not webdriver_port:
                 # Cleanup
-                container.stop()
-                container.remove()
+                discard_container(container)
                 raise BrowserProviderError("Timed out waiting for WebDriver", code="NOVNC_TIMEOUT", provider=self.code)
                 
             webdriver_url = f"http://localhost:{webdriver_port}/wd/hub" # Assuming standard selenium server URL structure? 
@@ -128,6 +132,8 @@ class NoVNCProvider(BrowserProvider):
                 novnc_url=novnc_url
             )
             
+        except BrowserProviderError:
+            raise
         except docker.errors.APIError as e:
             raise BrowserProviderError(f"Docker API error: {e}", code="NOVNC_DOCKER_ERROR", provider=self.code)
         except Exception as e:
@@ -146,6 +152,7 @@ class NoVNCProvider(BrowserProvider):
         try:
             logger.info(f"[{trace_id}] Stopping container {container_id[:12]}")
             container = self.client.containers.get(container_id)
+            # Graceful stop so Chrome flushes the persisted profile
             container.stop(timeout=5)
             container.remove()
         except docker.errors.NotFound:
@@ -153,7 +160,5 @@ class NoVNCProvider(BrowserProvider):
         except Exception as e:
             logger.error(f"[{trace_id}] Error stopping container: {e}")
 
-    def _is_port_open(self, host, port):
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(1)
-            return s.connect_ex((host, port)) == 0
+    def _is_port_open(self, host, port, timeout=1):
+        return is_port_open(host, port, timeout=timeout)
@@ -1,29 +1,39 @@
 from __future__ import annotations
 
-import os
 import time
-import socket
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 import docker
 from typing import Optional, Mapping, Any, Dict
 from datetime import datetime
 from loguru import logger
 
-from agent.browser_providers.base import BrowserProvider, BrowserSession, BrowserProviderError
+from agent.browser_providers.base import (
+    BrowserProvider, BrowserSession, BrowserProviderError, container_logs, docker_host_address,
+    discard_container, poll_intervals, probe_webdriver, sanitize_name, unique_suffix,
+)
 from agent.config import load_settings
 
 class RemoteHeadlessProvider(BrowserProvider):
     code = "REMOTE_HEADLESS"
 
     def __init__(self):
-        # We rely on docker.from_env() to pick up DOCKER_HOST if set
-        # But we also want to allow explicit config from settings if needed
-        self.settings = load_settings()
-        
+        # Container removal runs here so stop_session returns immediately
+        self._reaper = ThreadPoolExecutor(max_workers=8, thread_name_prefix="remote-headless-reaper")
+
+    @cached_property
+    def settings(self):
+        # We also want to allow explicit config from settings if needed
+        return load_settings()
+
+    @cached_property
+    def client(self) -> Optional[docker.DockerClient]:
+        """Docker client, created on first use; docker.from_env() picks up DOCKER_HOST if set."""
         try:
-            self.client = docker.from_env()
+            return docker.from_env()
         except Exception:
-            self.client = None
             logger.warning("Docker client failed to initialize. REMOTE_HEADLESS provider will fail if used.")
+            return None
 
     def start_session(
         self,
@@ -46,9 +56,9 @@ class RemoteHeadlessProvider(BrowserProvider):
         
         # 2. Start Container
         account_name = profile_row.dummy_account.name
-        safe_name = "".join(c for c in account_name if c.isalnum() or c in ('-','_'))
+        safe_name = sanitize_name(account_name)
         # Ensure unique container name
-        container_name = f"headless-{safe_name}-{trace_id[-6:]}-{int(time.time())}"
+        container_name = f"headless-{safe_name}-{trace_id[-6:]}-{unique_suffix()}"
         
         ports = {f"{internal_port}/tcp": None} # Let Docker assign random host port
         
@@ -75,61 +85,37 @@ class RemoteHeadlessProvider(BrowserProvider):
             )
             
             # 3. Wait for Readiness
-            container.reload()
             host_port = None
             
             # Get Mapped Port
             # Loop because sometimes it takes a split second for Docker to update port mappings API
-            retries = 30
-            while retries > 0:
+            deadline = time.monotonic() + 30
+            delays = poll_intervals()
+            while time.monotonic() < deadline:
                 container.reload()
                 if container.status != 'running' and container.status != 'created':
                      # If it exited immediately
-                     raise BrowserProviderError(f"Container exited: {container.logs().decode('utf-8')[:200]}", code="REMOTE_HEADLESS_CRASH", provider=self.code)
+                     logs = container_logs(container, tail=20)[-200:]
+                     discard_container(container)
+                     raise BrowserProviderError(f"Container exited: {logs}", code="REMOTE_HEADLESS_CRASH", provider=self.code)
                 
                 mapped = container.ports.get(f"{internal_port}/tcp")
                 if mapped:
                     host_port = mapped[0]['HostPort']
-                    # Verify connectivity
-                    # We need the Docker Host IP.
-                    # If we are remote, localhost might NOT be correct.
-                    # docker.from_env().base_url might give clue, but 'localhost' is standard assumption for port mapping unless DOCKER_HOST is IP.
-                    
-                    # Resolve Host
-                    # logic: if DOCKER_HOST is set, parse IP. Else localhost.
-                    docker_host_url = os.environ.get("DOCKER_HOST")
-                    target_host = "localhost"
-                    if docker_host_url and "tcp://" in docker_host_url:
-                        # Extract IP
-                        # tcp://1.2.3.4:2375 -> 1.2.3.4
-                        target_host = docker_host_url.split("://")[1].split(":")[0]
-                    
-                    # Check URL
-                    base_url = f"http://{target_host}:{host_port}"
-                    status_url = f"{base_url}/wd/hub/status"
-                    
-                    # Currently we just check TCP socket first
-                    if self._is_port_open(target_host, int(host_port)):
-                        # Ideally verify HTTP status 200/OK from /status
+                    # Verify on the Docker host (not localhost if the daemon is remote)
+                    # that the WebDriver answers /status, not just that the port accepts
+                    if self._probe_webdriver(f"http://{self._docker_host}:{host_port}/wd/hub") is None:
                         break
                 
-                time.sleep(1)
-                retries -= 1
+                time.sleep(next(delays))
             
             if not host_port:
-                 container.stop()
-                 container.remove()
+                 discard_container(container)
                  raise BrowserProviderError("Timed out waiting for mapped port", code="REMOTE_HEADLESS_TIMEOUT", provider=self.code)
 
-            # Re-resolve target host for final URL
-            docker_host_url = os.environ.get("DOCKER_HOST")
-            target_host = "localhost"
-            if docker_host_url and "tcp://" in docker_host_url:
-                target_host = docker_host_url.split("://")[1].split(":")[0]
-
             # Construct URL
             # Selenium Images typically use /wd/hub
-            webdriver_url = f"http://{target_host}:{host_port}/wd/hub"
+            webdriver_url = f"http://{self._docker_host}:{host_port}/wd/hub"
             
             return BrowserSession(
                 provider_code=self.code,
@@ -140,6 +126,8 @@ class RemoteHeadlessProvider(BrowserProvider):
                 novnc_url=None
             )
 
+        except BrowserProviderError:
+             raise
         except docker.errors.APIError as e:
              raise BrowserProviderError(f"Docker API Error: {e}", code="REMOTE_HEADLESS_DOCKER_ERROR", provider=self.code)
         except Exception as e:
@@ -150,25 +138,31 @@ class RemoteHeadlessProvider(BrowserProvider):
         session: BrowserSession,
         *,
         trace_id: str,
+        wait: bool = False,
     ) -> None:
+        """Remove the session's container in the background; `wait=True` blocks until done."""
         if not self.client: return
         
         cid = session.provider_session_ref
+        logger.info(f"[{trace_id}] Stopping Remote Headless container {cid[:8]}")
+        future = self._reaper.submit(self._remove_container, cid, trace_id)
+        if wait:
+            future.result()
+
+    def _remove_container(self, cid: str, trace_id: str) -> None:
+        # Headless Chrome keeps no state worth a graceful shutdown: force-remove
+        # kills and deletes in one API call instead of stop(timeout=5) + remove()
         try:
-            logger.info(f"[{trace_id}] Stopping Remote Headless container {cid[:8]}")
-            c = self.client.containers.get(cid)
-            c.stop(timeout=5)
-            c.remove()
+            self.client.containers.get(cid).remove(force=True)
         except docker.errors.NotFound:
             pass
         except Exception as e:
             logger.error(f"Failed to stop container {cid}: {e}")
 
-    def _is_port_open(self, host, port):
-        try:
-            with socket.create_connection((host, port), timeout=0.5):
-                return True
-        except (socket.timeout, ConnectionRefusedError):
-            return False
-        except OSError:
-            return False
+    @cached_property
+    def _docker_host(self) -> str:
+        """DOCKER_HOST's host, parsed on first use and kept for the provider's lifetime."""
+        return docker_host_address("localhost")
+
+    def _probe_webdriver(self, webdriver_url: str) -> Optional[str]:
+        return probe_webdriver(webdriver_url)
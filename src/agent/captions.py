@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 
-def generate_captions_from_title(title: str) -> Dict[str, Any]:
-    """Minimal placeholder for captions."""
-    base = title.strip() or "New video"
+def _captions(base: str) -> Dict[str, Any]:
+    # A fresh dict (and youtube dict/tags list) per video, so callers can edit one
+    # video's captions without touching another's
     return {
         "tiktok": f"{base} #shorts",
         "youtube": {
@@ -19,3 +19,12 @@ def generate_captions_from_title(title: str) -> Dict[str, Any]:
         "instagram": f"{base} #reel",
     }
 
+
+def generate_captions_from_title(title: str) -> Dict[str, Any]:
+    """Minimal placeholder for captions."""
+    return _captions(title.strip() or "New video")
+
+
+def generate_captions_batch(titles: List[str]) -> List[Dict[str, Any]]:
+    """generate_captions_from_title for many titles, in order."""
+    return [_captions(title.strip() or "New video") for title in titles]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict
 
@@ -96,8 +97,13 @@ def _env_bool(name: str, default: bool = False) -> bool:
     return value.lower() == "true"
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Build Settings from environment variables (.env for local dev)."""
+    """Build Settings from environment variables (.env for local dev).
+
+    Built once per process and shared; callers that override fields should
+    work on ``load_settings().model_copy(deep=True)``.
+    """
     try:
         tiktok = TikTokConfig(
             cookies_path=_env_path("TIKTOK_COOKIES_PATH"),
@@ -213,6 +213,9 @@ class Asset(Base):
         Index("idx_assets_campaign_status_created", "campaign_id", "status", "created_at"),
     )
 
+    # Fetch server defaults (timestamps) in the INSERT ... RETURNING instead of a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True) # Nullable for migration
     campaign_id: Mapped[Optional[int]] = mapped_column(ForeignKey("campaigns.id"), nullable=True)
@@ -260,6 +263,9 @@ class DummyAccount(Base):
         UniqueConstraint("platform_id", "username", name="uq_dummy_accounts_platform_username"),
     )
 
+    # Fetch server defaults (timestamps) in the INSERT ... RETURNING instead of a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     platform_id: Mapped[Optional[int]] = mapped_column(ForeignKey("platforms.id"), nullable=True)
     launch_group_id: Mapped[Optional[int]] = mapped_column(ForeignKey("launch_groups.id"), nullable=True)
@@ -19,9 +19,6 @@ from agent.services.assets import AssetService
 from agent.services.publishing_run_events import PublishingRunEventService
 from agent.workflow import run_cycle_single
 
-# Updated Model Import
-from agent.db.models import PublishingPost
-
 class PublishingJob:
     """Job to process publishing runs (Modernized for Schema v2)."""
 
@@ -31,12 +28,27 @@ class PublishingJob:
     from collections import defaultdict
     from tools.gologin_selenium import SyncGoLoginWebDriver
 
+    @staticmethod
+    def _release_browser(allocator, browser_session, driver_instance, shared_driver, trace_id: str) -> None:
+        """Quit our Remote connection and stop the allocated session, so the provider frees it."""
+        if driver_instance is not None and driver_instance is not shared_driver:
+            try:
+                driver_instance.quit()
+            except Exception as e:
+                logger.warning(f"[JOB] Failed to quit remote driver: {e}")
+        if browser_session is not None:
+            try:
+                allocator.stop_session(browser_session, trace_id=trace_id)
+            except Exception as e:
+                logger.warning(f"[JOB] Failed to stop {browser_session.provider_code} session: {e}")
+
     def execute_run(self, run_id: int, driver=None) -> Dict[str, Any]:
         """Execute a single publishing run (post)."""
         session = SessionLocal()
+        allocator = browser_session = driver_instance = None
         try:
             # 1. Fetch run (Post) and dependencies
-            run = session.get(PublishingPost, run_id)
+            run = PublishingRunService.get_post_for_execution(session, run_id)
             if not run:
                 logger.error(f"[JOB] Post {run_id} not found")
                 return {"status": "error", "message": "Post not found"}
@@ -241,6 +253,7 @@ class PublishingJob:
                 from agent.services.browser_provider_allocator import BrowserProviderAllocator
                 from selenium import webdriver
                 from selenium.webdriver.chrome.options import Options
+                from selenium.webdriver.remote.file_detector import LocalFileDetector
                 
                 allocator = BrowserProviderAllocator()
                 
@@ -326,6 +339,8 @@ class PublishingJob:
                             command_executor=browser_session.webdriver_url,
                             options=opts
                         )
+                        # Stream local video files to the remote node on <input type=file> send_keys
+                        driver_instance.file_detector = LocalFileDetector()
                     elif browser_session.provider_code == "GOLOGIN":
                         # GOLOGIN
                         # gologin_provider.py returned 'executor_url' effectively.
@@ -366,6 +381,7 @@ class PublishingJob:
                                 command_executor=browser_session.webdriver_url,
                                 options=opts
                             )
+                            driver_instance.file_detector = LocalFileDetector()
                         else:
                             raise ValueError("GoLogin session allocated but no driver or webdriver_url available.")
                     
@@ -384,6 +400,8 @@ class PublishingJob:
                          gologin_token=gologin_token_param,
                          gologin_profile_id=gologin_profile_id_param
                     )
+                    self._release_browser(allocator, browser_session, driver_instance, driver, f"run-{run_id}")
+                    browser_session = driver_instance = None
                     
                     platform_result = results.get(platform_key, {})
                     status = platform_result.get("status")
@@ -505,6 +523,8 @@ class PublishingJob:
             logger.exception(f"[JOB] System error in post {run_id}")
             return {"status": "system_error", "error": str(e)}
         finally:
+            if allocator is not None:
+                self._release_browser(allocator, browser_session, driver_instance, driver, f"run-{run_id}")
             if 'materializer' in locals() and materializer:
                 materializer.cleanup()
             session.close()
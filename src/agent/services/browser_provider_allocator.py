@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import select, and_, func
 from typing import Optional, Tuple, Mapping
+from datetime import datetime, timezone
 from loguru import logger
 import uuid
 
@@ -15,10 +16,11 @@ class BrowserProviderAllocator:
     
     def __init__(self):
         self.settings = load_settings()
+        novnc_aws = NovncAwsProvider()
         self.providers = {
             "GOLOGIN": GoLoginProvider(),
-            "NOVNC_AWS": NovncAwsProvider(),
-            "NOVNC": NovncAwsProvider(), # Alias for backward compatibility if needed
+            "NOVNC_AWS": novnc_aws,
+            "NOVNC": novnc_aws, # Alias for backward compatibility if needed (same instance)
         }
 
     def allocate_for_dummy_account(
@@ -91,7 +93,10 @@ class BrowserProviderAllocator:
                     profile,
                     trace_id=trace_id
                 )
-                
+
+                # Persisted with the caller's commit; one timestamp per successful start
+                profile.last_used_at = datetime.now(timezone.utc)
+
                 return browser_session
                 
             except Exception as e:
@@ -3,11 +3,11 @@ from __future__ import annotations
 
 from typing import Optional, List
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import select, desc, or_, func
 
 # Updated imports for new schema
-from agent.db.models import PublishingPost, PublishingPostContent, PublishingRun, Platform, PublishingPostAsset
+from agent.db.models import PublishingPost, PublishingPostContent, PublishingRun, Platform, PublishingPostAsset, BrowserProviderProfile
 from agent.services.browser_provider_allocator import BrowserProviderAllocator
 
 class PublishingRunService:
@@ -151,11 +151,30 @@ class PublishingRunService:
             PublishingPost.id.asc()
         ).limit(limit)
         
-        # We might want to eager load dependencies
-        # query = query.options(joinedload(PublishingPost.assets), joinedload(PublishingPost.content))
+        # Eager load the account so grouping by account name in the job
+        # does not lazy-load one SELECT per post.
+        query = query.options(joinedload(PublishingPost.dummy_account))
         
         return list(session.execute(query).scalars().all())
 
+    @staticmethod
+    def get_post_for_execution(
+        session: Session,
+        post_id: int,
+    ) -> Optional[PublishingPost]:
+        """
+        Get a post with everything execute_run traverses loaded up front.
+        One-to-one/many-to-one links are joined, collections use SELECT IN.
+        """
+        query = select(PublishingPost).where(PublishingPost.id == post_id).options(
+            joinedload(PublishingPost.content),
+            joinedload(PublishingPost.platform),
+            joinedload(PublishingPost.dummy_account),
+            joinedload(PublishingPost.run).joinedload(PublishingRun.browser_profile).joinedload(BrowserProviderProfile.provider),
+            selectinload(PublishingPost.assets).joinedload(PublishingPostAsset.asset),
+        )
+        return session.execute(query).unique().scalar_one_or_none()
+
     @staticmethod
     def get_runs_for_account(
         session: Session,
@@ -17,7 +17,9 @@ from agent.state import UploadState
 def build_drive_client(sa_json_path: Path):
     """Build a Google Drive service client from a service account JSON file."""
     creds = Credentials.from_service_account_file(str(sa_json_path))
-    return build("drive", "v3", credentials=creds)
+    # Use the discovery document bundled with google-api-python-client instead of
+    # fetching it over HTTP; the on-disk discovery cache is then never consulted.
+    return build("drive", "v3", credentials=creds, static_discovery=True, cache_discovery=False)
 
 
 def list_videos_in_folder(service, folder_id: str) -> List[Dict[str, Any]]:
@@ -83,7 +83,8 @@ class GoLoginWebDriver:
             self.driver.execute_script("arguments[0].click();", element)
 
 import asyncio
-from typing import Optional
+import atexit
+from typing import Dict, Optional
 
 class SyncGoLoginWebDriver:
     """Synchronous context manager wrapper for GoLoginWebDriver."""
@@ -114,3 +115,57 @@ class SyncGoLoginWebDriver:
         if self._async_cm and self._loop:
             self._loop.run_until_complete(self._async_cm.__aexit__(exc_type, exc_val, exc_tb))
         return False # Propagate exceptions if any, or just finish cleanly
+
+    def start_driver(self) -> WebDriver:
+        """Launch the profile outside a `with` block; pair with stop_driver()."""
+        return self.__enter__()
+
+    def stop_driver(self) -> None:
+        """Stop the profile launched by start_driver()."""
+        self.__exit__(None, None, None)
+
+
+# Warm GoLogin sessions keyed by profile id, for scripts that check the same
+# profile repeatedly (GoLoginProvider tracks the sessions it starts itself)
+_DRIVER_CACHE: Dict[str, SyncGoLoginWebDriver] = {}
+
+
+def _is_alive(driver: WebDriver) -> bool:
+    """Whether the driver still answers; a crashed Orbita/chromedriver raises."""
+    try:
+        driver.window_handles
+        return True
+    except Exception:
+        return False
+
+
+def get_or_launch(token_or_manager, profile_id: str) -> WebDriver:
+    """Return a running driver for `profile_id`, launching the profile on first use.
+
+    Later calls in the same process reuse the started Orbita session instead of
+    paying the profile download/start again; a session that no longer answers
+    is stopped and relaunched. Callers must not quit the driver.
+    """
+    session = _DRIVER_CACHE.get(profile_id)
+    if session is not None and not _is_alive(session.driver):
+        del _DRIVER_CACHE[profile_id]
+        try:
+            session.stop_driver()
+        except Exception:
+            pass  # Already gone
+        session = None
+    if session is None:
+        session = SyncGoLoginWebDriver(token_or_manager, profile_id)
+        session.start_driver()
+        _DRIVER_CACHE[profile_id] = session
+    return session.driver
+
+
+@atexit.register
+def _stop_cached_drivers() -> None:
+    while _DRIVER_CACHE:
+        _, session = _DRIVER_CACHE.popitem()
+        try:
+            session.stop_driver()
+        except Exception:
+            pass
@@ -0,0 +1,27 @@
+
+import asyncio
+import os
+from unittest.mock import MagicMock
+from agent.browser_providers.base import BrowserProviderError, start_sessions, unique_suffix
+
+def test_start_sessions_returns_results_in_profile_order():
+    provider = MagicMock()
+    failure = BrowserProviderError("boom", code="NOVNC_AWS_TIMEOUT")
+
+    def start_session(profile_row, *, trace_id):
+        if profile_row == "bad":
+            raise failure
+        return f"session-{profile_row}-{trace_id}"
+
+    provider.start_session.side_effect = start_session
+
+    results = asyncio.run(start_sessions(provider, ["a", "bad", "c"], trace_id="batch"))
+
+    # One failed start does not hide the sessions that did start
+    assert results == ["session-a-batch-0", failure, "session-c-batch-2"]
+
+def test_unique_suffix_differs_within_the_same_second():
+    suffixes = {unique_suffix() for _ in range(100)}
+
+    assert len(suffixes) == 100
+    assert all(s.startswith(f"{os.getpid()}-") for s in suffixes)
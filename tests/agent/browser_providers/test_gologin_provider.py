@@ -0,0 +1,87 @@
+
+import pytest
+from unittest.mock import MagicMock, patch
+from agent.browser_providers.gologin_provider import GoLoginProvider, BrowserProviderError
+
+@patch("agent.browser_providers.gologin_provider.SyncGoLoginWebDriver")
+@patch("agent.browser_providers.gologin_provider.load_settings")
+def test_gologin_start_then_stop_session(mock_load_settings, mock_wrapper_cls):
+    mock_load_settings.return_value.gologin_accounts = {}
+
+    mock_wrapper = MagicMock()
+    mock_wrapper.start_driver.return_value.command_executor._url = "http://127.0.0.1:9515"
+    mock_wrapper_cls.return_value = mock_wrapper
+
+    provider = GoLoginProvider()
+
+    mock_profile = MagicMock()
+    mock_profile.id = 7
+    mock_profile.provider_profile_ref = "gl_profile_abc"
+
+    session = provider.start_session(mock_profile, trace_id="trace-gl", extra={"gologin_token": "tok"})
+
+    assert session.provider_session_ref == "gl_profile_abc"
+    assert session.webdriver_url == "http://127.0.0.1:9515"
+    mock_wrapper_cls.assert_called_with("tok", "gl_profile_abc")
+
+    provider.stop_session(session, trace_id="trace-gl")
+    mock_wrapper.stop_driver.assert_called_once()
+
+    # A second stop finds nothing registered and is a no-op
+    provider.stop_session(session, trace_id="trace-gl")
+    mock_wrapper.stop_driver.assert_called_once()
+
+@patch("agent.browser_providers.gologin_provider.SyncGoLoginWebDriver")
+@patch("agent.browser_providers.gologin_provider.load_settings")
+def test_gologin_start_error_is_classified(mock_load_settings, mock_wrapper_cls):
+    mock_load_settings.return_value.gologin_accounts = {}
+    mock_wrapper_cls.return_value.start_driver.side_effect = Exception("Profile launch Limit exceeded")
+
+    provider = GoLoginProvider()
+    mock_profile = MagicMock()
+    mock_profile.provider_profile_ref = "gl_profile_abc"
+
+    with pytest.raises(BrowserProviderError) as exc:
+        provider.start_session(mock_profile, trace_id="trace-gl", extra={"gologin_token": "tok"})
+
+    assert exc.value.code == "GOLOGIN_LIMIT_REACHED"
+
+@patch("agent.browser_providers.gologin_provider.SyncGoLoginWebDriver")
+@patch("agent.browser_providers.gologin_provider.load_settings")
+def test_gologin_second_start_of_running_profile_is_refused(mock_load_settings, mock_wrapper_cls):
+    mock_load_settings.return_value.gologin_accounts = {}
+    mock_wrapper_cls.return_value.start_driver.return_value.command_executor._url = "http://127.0.0.1:9515"
+
+    provider = GoLoginProvider()
+    mock_profile = MagicMock()
+    mock_profile.provider_profile_ref = "gl_profile_abc"
+
+    session = provider.start_session(mock_profile, trace_id="trace-gl", extra={"gologin_token": "tok"})
+
+    with pytest.raises(BrowserProviderError) as exc:
+        provider.start_session(mock_profile, trace_id="trace-gl-2", extra={"gologin_token": "tok"})
+
+    assert exc.value.code == "GOLOGIN_PROFILE_IN_USE"
+    # The running browser was neither replaced nor stopped; only one was launched
+    assert mock_wrapper_cls.return_value.start_driver.call_count == 1
+    mock_wrapper_cls.return_value.stop_driver.assert_not_called()
+
+    # Once stopped, the profile can be started again
+    provider.stop_session(session, trace_id="trace-gl")
+    provider.start_session(mock_profile, trace_id="trace-gl-3", extra={"gologin_token": "tok"})
+
+@patch("agent.browser_providers.gologin_provider.SyncGoLoginWebDriver")
+@patch("agent.browser_providers.gologin_provider.load_settings")
+def test_gologin_failed_start_releases_profile(mock_load_settings, mock_wrapper_cls):
+    mock_load_settings.return_value.gologin_accounts = {}
+    mock_wrapper_cls.return_value.start_driver.side_effect = [Exception("boom"), MagicMock()]
+
+    provider = GoLoginProvider()
+    mock_profile = MagicMock()
+    mock_profile.provider_profile_ref = "gl_profile_abc"
+
+    with pytest.raises(BrowserProviderError):
+        provider.start_session(mock_profile, trace_id="trace-gl", extra={"gologin_token": "tok"})
+
+    # The failed start does not leave the profile marked as running
+    provider.start_session(mock_profile, trace_id="trace-gl-2", extra={"gologin_token": "tok"})
@@ -1,8 +1,15 @@
 
 import pytest
 from unittest.mock import MagicMock, patch
+from agent.browser_providers import novnc_aws_provider
 from agent.browser_providers.novnc_aws_provider import NovncAwsProvider, BrowserProviderError
 
+@pytest.fixture(autouse=True)
+def reset_image_state():
+    # Image pull state is per process; start each test with nothing pulled
+    novnc_aws_provider._image_ready.clear()
+    novnc_aws_provider._prepull_started.clear()
+
 @patch("agent.browser_providers.novnc_aws_provider.docker")
 def test_novnc_aws_start_session(mock_docker):
     # Setup Mocks
@@ -26,8 +33,8 @@ def test_novnc_aws_start_session(mock_docker):
     mock_profile.provider.config = {"docker_image": "social/novnc-browser:latest", "default_webdriver_port": 4444}
     mock_profile.dummy_account.name = "awsuser"
     
-    # Mock Socket check & Host resolution
-    with patch.object(provider, '_is_port_open', return_value=True):
+    # Mock ChromeDriver status probe & Host resolution
+    with patch.object(provider, '_probe_webdriver', return_value=None) as mock_probe:
         with patch.dict('os.environ', {'DOCKER_HOST': 'tcp://54.1.2.3:2375'}):
              session = provider.start_session(mock_profile, trace_id="trace-aws")
              
@@ -36,10 +43,16 @@ def test_novnc_aws_start_session(mock_docker):
              # Verify Remote IP usage
              assert "http://54.1.2.3:32000" in session.webdriver_url
              assert "http://54.1.2.3:32001" in session.novnc_url
+             mock_probe.assert_called_with("http://54.1.2.3:32000/wd/hub")
 
 @patch("agent.browser_providers.novnc_aws_provider.docker")
-@patch("agent.browser_providers.novnc_aws_provider.time.sleep")
-def test_novnc_aws_start_session_timeout(mock_sleep, mock_docker):
+@patch("agent.browser_providers.novnc_aws_provider.time")
+def test_novnc_aws_start_session_timeout(mock_time, mock_docker):
+    # Fake clock: sleeping advances monotonic time, so the deadline passes instantly
+    clock = [0.0]
+    mock_time.monotonic.side_effect = lambda: clock[0]
+    mock_time.sleep.side_effect = lambda secs: clock.__setitem__(0, clock[0] + secs)
+
     mock_client = MagicMock()
     # Mock APIError so it can be caught
     mock_docker.errors.APIError = type("APIError", (Exception,), {})
@@ -55,11 +68,113 @@ def test_novnc_aws_start_session_timeout(mock_sleep, mock_docker):
     mock_profile = MagicMock()
     mock_profile.dummy_account.name = "awsuser"
 
-    with patch.object(provider, '_is_port_open', return_value=False):
+    with patch.object(provider, '_probe_webdriver', return_value="not listening"):
         with pytest.raises(BrowserProviderError) as exc:
              provider.start_session(mock_profile, trace_id="trace-fail")
         
         assert "Timed out" in str(exc.value)
-        mock_container.stop.assert_called()
-        mock_container.remove.assert_called()
+        assert exc.value.code == "NOVNC_AWS_TIMEOUT"
+        # One force-remove (kill + delete) instead of stop() + remove()
+        mock_container.remove.assert_called_once_with(force=True)
+        mock_container.stop.assert_not_called()
+        # Polls back off from 100ms and never sleep longer than 1s
+        sleeps = [c.args[0] for c in mock_time.sleep.call_args_list]
+        assert sleeps[0] == 0.1
+        assert max(sleeps) == 1.0
+
+
+@patch("agent.browser_providers.novnc_aws_provider.docker")
+@patch("agent.browser_providers.novnc_aws_provider.time")
+def test_novnc_aws_start_session_inspects_sparingly_once_mapped(mock_time, mock_docker):
+    clock = [0.0]
+    mock_time.monotonic.side_effect = lambda: clock[0]
+    mock_time.sleep.side_effect = lambda secs: clock.__setitem__(0, clock[0] + secs)
+
+    mock_client = MagicMock()
+    mock_docker.errors.APIError = type("APIError", (Exception,), {})
+    mock_docker.from_env.return_value = mock_client
+
+    mock_container = MagicMock()
+    mock_container.status = 'running'
+    mock_container.ports.get.side_effect = lambda k: [{'HostPort': '32000'}] if k == '4444/tcp' else [{'HostPort': '32001'}]
+    mock_client.containers.run.return_value = mock_container
+
+    provider = NovncAwsProvider()
+    mock_profile = MagicMock()
+    mock_profile.provider.config = {"default_webdriver_port": 4444}
+    mock_profile.dummy_account.name = "awsuser"
+
+    # ChromeDriver answers only on the 20th probe (~15s of polling)
+    probe_results = ["ConnectionRefused"] * 19 + [None]
+    with patch.object(provider, '_probe_webdriver', side_effect=probe_results) as mock_probe:
+        session = provider.start_session(mock_profile, trace_id="trace-slow")
+
+    assert session.provider_session_ref == mock_container.id
+    assert mock_probe.call_count == 20
+    # Port map is known from the first poll; afterwards inspects only every 5s
+    assert mock_container.reload.call_count <= 6
+
+@patch("agent.browser_providers.novnc_aws_provider.docker")
+def test_novnc_aws_start_session_reports_crash_with_logs(mock_docker):
+    mock_client = MagicMock()
+    mock_docker.from_env.return_value = mock_client
+
+    mock_container = MagicMock()
+    mock_container.status = 'exited'
+    mock_container.logs.return_value = b"chromedriver: segfault\n"
+    mock_client.containers.run.return_value = mock_container
+
+    provider = NovncAwsProvider()
+    mock_profile = MagicMock()
+    mock_profile.dummy_account.name = "awsuser"
+
+    with pytest.raises(BrowserProviderError) as exc:
+        provider.start_session(mock_profile, trace_id="trace-crash")
+
+    assert exc.value.code == "NOVNC_AWS_CRASH"
+    assert "chromedriver: segfault" in str(exc.value)
+    # Logs are read before the exited container is removed
+    mock_container.remove.assert_called_once_with(force=True)
+
+@patch("agent.browser_providers.novnc_aws_provider.docker")
+def test_novnc_aws_pulls_missing_image_once(mock_docker):
+    from concurrent.futures import ThreadPoolExecutor
+
+    mock_docker.errors.ImageNotFound = type("ImageNotFound", (Exception,), {})
+    mock_client = MagicMock()
+    mock_docker.from_env.return_value = mock_client
+    mock_client.images.get.side_effect = mock_docker.errors.ImageNotFound()
+
+    providers = [NovncAwsProvider(), NovncAwsProvider()]
+
+    # Concurrent starts for the same missing image share one pull, across instances
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda i: providers[i % 2]._ensure_image("social/novnc-browser:latest", f"trace-{i}"), range(4)))
+
+    mock_client.images.pull.assert_called_once_with("social/novnc-browser:latest")
+
+@patch("agent.browser_providers.novnc_aws_provider.threading.Thread")
+def test_novnc_aws_prepulls_env_image_once_per_process(mock_thread):
+    with patch.dict('os.environ', {'NOVNC_IMAGE_URI': 'social/novnc-browser:latest'}):
+        NovncAwsProvider()
+        NovncAwsProvider()
+
+    mock_thread.assert_called_once()
+    assert mock_thread.call_args.kwargs["args"] == ("social/novnc-browser:latest",)
+
+@patch("agent.browser_providers.novnc_aws_provider.docker")
+def test_novnc_aws_stop_session(mock_docker):
+    mock_client = MagicMock()
+    mock_docker.from_env.return_value = mock_client
+    mock_container = MagicMock()
+    mock_client.containers.get.return_value = mock_container
+
+    provider = NovncAwsProvider()
+    session = MagicMock()
+    session.provider_session_ref = "aws_container_123"
+
+    provider.stop_session(session, trace_id="trace-stop", wait=True)
 
+    mock_client.containers.get.assert_called_with("aws_container_123")
+    mock_container.stop.assert_not_called()
+    mock_container.remove.assert_called_once_with(force=True)
@@ -26,10 +26,13 @@ def test_novnc_provider_start_session(mock_docker):
     mock_profile.id = 1
     mock_profile.dummy_account.name = "testuser"
     
-    # Mock socket check to be always open
-    with patch.object(provider, '_is_port_open', return_value=True):
+    # Mock socket check: ChromeDriver listens on the third probe
+    with patch.object(provider, '_is_port_open', side_effect=[False, False, True]) as mock_open:
         session = provider.start_session(mock_profile, trace_id="trace-1")
     
+    # Connect timeout starts short and widens with each failed probe
+    assert [c.args[2] for c in mock_open.call_args_list] == pytest.approx([0.05, 0.075, 0.1125])
+    
     assert session.provider_code == "NOVNC"
     assert session.provider_session_ref == "container_123"
     assert "32768" in session.webdriver_url
@@ -40,6 +43,8 @@ def test_novnc_provider_start_session(mock_docker):
     args, kwargs = mock_client.containers.run.call_args
     assert "social/novnc-browser:latest" in args or kwargs.get('image')
     assert "novnc-testuser" in kwargs['name']
+    # The profile is a host bind mount, kept when the container is removed
+    assert any(v['bind'] == '/home/browser_user/.browser_profile' for v in kwargs['volumes'].values())
 
 @patch("agent.browser_providers.novnc_provider.docker")
 def test_novnc_provider_stop_session(mock_docker):
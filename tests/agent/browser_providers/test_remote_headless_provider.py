@@ -25,8 +25,8 @@ def test_remote_headless_start_session(mock_docker):
     mock_profile.dummy_account.name = "remoteuser"
     mock_profile.provider.config = {"default_webdriver_port": 4444}
     
-    # Mock Port Open check
-    with patch.object(provider, '_is_port_open', return_value=True):
+    # Mock WebDriver status probe
+    with patch.object(provider, '_probe_webdriver', return_value=None) as mock_probe:
          # Mock DOCKER_HOST env
          with patch.dict('os.environ', {'DOCKER_HOST': 'tcp://192.168.1.50:2375'}):
              session = provider.start_session(mock_profile, trace_id="trace-remote")
@@ -35,6 +35,29 @@ def test_remote_headless_start_session(mock_docker):
              assert session.provider_session_ref == "container_remote_123"
              # Verify URL reflects remote host IP
              assert "http://192.168.1.50:33333/wd/hub" == session.webdriver_url
+             mock_probe.assert_called_with("http://192.168.1.50:33333/wd/hub")
+
+@patch("agent.browser_providers.remote_headless_provider.docker")
+def test_remote_headless_start_session_reports_crash_with_logs(mock_docker):
+    mock_client = MagicMock()
+    mock_docker.from_env.return_value = mock_client
+
+    mock_container = MagicMock()
+    mock_container.status = 'exited'
+    mock_container.logs.return_value = b"chrome: cannot open display\n"
+    mock_client.containers.run.return_value = mock_container
+
+    provider = RemoteHeadlessProvider()
+    mock_profile = MagicMock()
+    mock_profile.dummy_account.name = "remoteuser"
+    mock_profile.provider.config = {"default_webdriver_port": 4444}
+
+    with pytest.raises(BrowserProviderError) as exc:
+        provider.start_session(mock_profile, trace_id="trace-crash")
+
+    assert exc.value.code == "REMOTE_HEADLESS_CRASH"
+    assert "cannot open display" in str(exc.value)
+    mock_container.remove.assert_called_once_with(force=True)
 
 @patch("agent.browser_providers.remote_headless_provider.docker")
 def test_remote_headless_stop_session(mock_docker):
@@ -48,8 +71,9 @@ def test_remote_headless_stop_session(mock_docker):
     session = MagicMock()
     session.provider_session_ref = "cid_999"
     
-    provider.stop_session(session, trace_id="trace-stop")
+    provider.stop_session(session, trace_id="trace-stop", wait=True)
     
     mock_client.containers.get.assert_called_with("cid_999")
-    mock_container.stop.assert_called_once()
-    mock_container.remove.assert_called_once()
+    # Force-remove (SIGKILL + delete) instead of a graceful stop + remove
+    mock_container.stop.assert_not_called()
+    mock_container.remove.assert_called_once_with(force=True)